@@ -12,9 +12,369 @@ Data: Wrzesień 2025
 
 import numpy as np
 from datetime import datetime
+import bisect
+import functools
+from dataclasses import dataclass, fields
+import hashlib
 import json
+import logging
+import math
+import os
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, List, Tuple, Optional
 
+try:
+    from numba import njit
+    _HAS_NUMBA = True
+except ImportError:
+    # Numba opcjonalna - bez niej punkty zalewu liczone są wektorowo w NumPy
+    _HAS_NUMBA = False
+
+try:
+    import orjson
+except ImportError:
+    # orjson opcjonalny - eksport przez bibliotekę standardową json
+    orjson = None
+
+logger = logging.getLogger("floodsim")
+
+# Poziomy ryzyka powodziowego i progi głębokości [m] między nimi
+_RISK_LEVELS = ("MINIMALNE", "NISKIE", "UMIARKOWANE", "WYSOKIE", "KRYTYCZNE")
+_RISK_THRESHOLDS = (0.05, 0.15, 0.40, 0.80)
+
+# Typy powierzchni punktów zalewu i ich udział w centrum miasta
+_SURFACE_TYPES = ("road", "sidewalk", "green", "plaza")
+_SURFACE_PROBABILITIES = (0.4, 0.25, 0.2, 0.15)
+
+# Dystrybuanta typów powierzchni (normalizowana jak w Generator.choice, więc losowania są zgodne)
+_SURFACE_CDF = np.cumsum(_SURFACE_PROBABILITIES)
+_SURFACE_CDF /= _SURFACE_CDF[-1]
+
+# Sekcje wyniku, które można wybrać argumentem fields w simulate_scenario
+_RESULT_SECTIONS = frozenset({"parameters", "hydraulic_conditions", "metrics", "impact_assessment"})
+
+
+def _stable_seed(scenario_name: str) -> int:
+    """Ziarno RNG niezależne od procesu (wbudowany hash() jest solony per proces)."""
+    return int.from_bytes(hashlib.blake2s(scenario_name.encode(), digest_size=4).digest(), 'little')
+
+
+def _gen_zones_np(rng: np.random.Generator, n: int, center_lat: float, center_lng: float,
+                  base_elevation: float, max_depth: float, max_flow_velocity: float):
+    """Losuje kolumny punktów zalewu wektorowo w NumPy (wariant bez numby)."""
+    # Lokalizacja w okolicy centrum z rozkładem normalnym (~±900m, ~±1200m)
+    offsets = rng.normal(0, [0.008, 0.012], size=(n, 2))
+    lat = center_lat + offsets[:, 0]
+    lng = center_lng + offsets[:, 1]
+
+    # Głębokość z rozkładem wykładniczym (więcej płytkich zalewów)
+    if max_depth > 0:
+        depth = np.minimum(np.maximum(rng.exponential(max_depth * 0.6, size=n), 0.02), max_depth)
+    else:
+        depth = np.full(n, 0.02)
+
+    # Prędkość przepływu (uproszczona formuła Manning-Strickler)
+    flow_velocity = np.minimum(np.sqrt(depth) * 1.5, max_flow_velocity)
+
+    # Wysokość terenu (wartość bazowa ± wariacja)
+    elevation = base_elevation + rng.normal(0, 2, size=n)
+
+    # Typ powierzchni (losowanie ważone po gotowej dystrybuancie)
+    surface_idx = np.searchsorted(_SURFACE_CDF, rng.random(n), side='right')
+
+    return lat, lng, depth, elevation, flow_velocity, surface_idx
+
+
+if _HAS_NUMBA:
+    @njit(cache=True)
+    def _gen_zones_nb(rng, n, center_lat, center_lng, base_elevation, max_depth, max_flow_velocity):
+        """
+        Ta sama procedura co _gen_zones_np, skompilowana numbą.
+        
+        Losowania idą w tej samej kolejności co w wariancie NumPy, więc przy tym
+        samym Generatorze oba warianty dają identyczne punkty.
+        """
+        lat = np.empty(n)
+        lng = np.empty(n)
+        depth = np.empty(n)
+        elevation = np.empty(n)
+        flow_velocity = np.empty(n)
+        surface_idx = np.empty(n, dtype=np.int64)
+
+        for i in range(n):
+            lat[i] = center_lat + rng.normal(0.0, 0.008)
+            lng[i] = center_lng + rng.normal(0.0, 0.012)
+
+        for i in range(n):
+            if max_depth > 0:
+                depth[i] = min(max(rng.exponential(max_depth * 0.6), 0.02), max_depth)
+            else:
+                depth[i] = 0.02
+            flow_velocity[i] = min(math.sqrt(depth[i]) * 1.5, max_flow_velocity)
+
+        for i in range(n):
+            elevation[i] = base_elevation + rng.normal(0.0, 2.0)
+
+        # Losowanie ważone typu powierzchni po dystrybuancie
+        for i in range(n):
+            surface_idx[i] = np.searchsorted(_SURFACE_CDF, rng.random(), side='right')
+
+        return lat, lng, depth, elevation, flow_velocity, surface_idx
+
+    _gen_zones = _gen_zones_nb
+else:
+    _gen_zones = _gen_zones_np
+
+
+@dataclass(frozen=True)
+class FloodZones:
+    """
+    Punkty zalewu w układzie kolumnowym (jedna tablica NumPy na atrybut).
+    
+    Wartości są już zaokrąglone do precyzji eksportu; zone_id to kolejny
+    numer punktu (1..n). Słowniki per punkt powstają dopiero w to_records()
+    albo przy indeksowaniu (zones[0] - jak dla listy z generate_flood_zones).
+    
+    Attributes:
+        lat (np.ndarray): Szerokość geograficzna [°]
+        lng (np.ndarray): Długość geograficzna [°]
+        depth_m (np.ndarray): Głębokość zalewu [m]
+        elevation_m (np.ndarray): Wysokość terenu [m n.p.m.]
+        flow_velocity (np.ndarray): Prędkość przepływu [m/s]
+        surface_code (np.ndarray): Indeks typu powierzchni w _SURFACE_TYPES
+    """
+    lat: np.ndarray
+    lng: np.ndarray
+    depth_m: np.ndarray
+    elevation_m: np.ndarray
+    flow_velocity: np.ndarray
+    surface_code: np.ndarray
+    
+    def __len__(self) -> int:
+        return len(self.lat)
+    
+    def __iter__(self):
+        return iter(self.to_records())
+    
+    def __getitem__(self, index):
+        # Zgodność wstecz z listą słowników (result['flood_zones'][0]['depth_m'])
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        i = range(len(self))[index]
+        return {
+            "lat": float(self.lat[i]),
+            "lng": float(self.lng[i]),
+            "depth_m": float(self.depth_m[i]),
+            "elevation_m": float(self.elevation_m[i]),
+            "flow_velocity": float(self.flow_velocity[i]),
+            "zone_id": i + 1,
+            "surface_type": _SURFACE_TYPES[int(self.surface_code[i])]
+        }
+    
+    def to_records(self) -> List[Dict]:
+        """Zamienia kolumny na listę słowników (format JSON punktów zalewu)."""
+        return [
+            {
+                "lat": lat,
+                "lng": lng,
+                "depth_m": depth,
+                "elevation_m": elevation,
+                "flow_velocity": velocity,
+                "zone_id": zone_id,
+                "surface_type": _SURFACE_TYPES[code]
+            }
+            for zone_id, lat, lng, depth, elevation, velocity, code in zip(
+                range(1, len(self) + 1),
+                self.lat.tolist(),
+                self.lng.tolist(),
+                self.depth_m.tolist(),
+                self.elevation_m.tolist(),
+                self.flow_velocity.tolist(),
+                self.surface_code.tolist()
+            )
+        ]
+
+
+class _Record:
+    """
+    Wspólny interfejs rekordów wyników: odczyt jak ze słownika i konwersja do dict.
+    
+    Rekordy zastępują dawne zagnieżdżone słowniki, więc obsługują protokół
+    mapowania tylko do odczytu (result['metrics']['max_depth_m'], 'pmv' in ..., get, keys,
+    items, iteracja, len). Nie są jednak instancjami dict - json.dumps wymaga
+    default=_export_default (tak eksportuje export_results).
+    """
+    __slots__ = ()
+    
+    def __getitem__(self, key: str):
+        try:
+            return getattr(self, key)
+        except (AttributeError, TypeError):
+            raise KeyError(key) from None
+    
+    def keys(self) -> List[str]:
+        return [f.name for f in fields(self)]
+    
+    def values(self) -> List:
+        return [getattr(self, key) for key in self.keys()]
+    
+    def items(self) -> List[Tuple]:
+        return [(key, getattr(self, key)) for key in self.keys()]
+    
+    def get(self, key: str, default=None):
+        return getattr(self, key) if key in self else default
+    
+    def __contains__(self, key) -> bool:
+        return key in self.keys()
+    
+    def __iter__(self):
+        return iter(self.keys())
+    
+    def __len__(self) -> int:
+        return len(self.keys())
+    
+    def to_dict(self) -> Dict:
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+
+@dataclass(slots=True)
+class FloodParameters(_Record):
+    """Parametry wejściowe scenariusza opadowego."""
+    rainfall_mm_h: float
+    duration_h: float
+    total_rainfall_mm: float
+    effective_rainfall_mm: float
+    excess_rainfall_mm: float
+    runoff_coefficient: float
+
+
+@dataclass(slots=True)
+class HydraulicConditions(_Record):
+    """Charakterystyki hydrologiczne obszaru użyte w symulacji."""
+    drainage_capacity_mm_h: float
+    infiltration_rate_mm_h: float
+    manning_roughness: float
+    urban_coverage_percent: float
+
+
+@dataclass(slots=True)
+class FloodMetrics(_Record):
+    """Wskaźniki zalewu (głębokość, zasięg, objętość, ryzyko)."""
+    max_depth_m: float
+    mean_depth_m: float
+    flooded_area_km2: float
+    flooded_area_percent: float
+    total_volume_m3: float
+    peak_flow_velocity_ms: float
+    risk_level: str
+    risk_score: int
+
+
+@dataclass(slots=True)
+class ImpactAssessment(_Record):
+    """Wpływ zalewu na budynki, ludność i straty ekonomiczne."""
+    buildings_total: int
+    buildings_at_risk: int
+    affected_population: int
+    economic_damage_pln: int
+    economic_damage_eur: float
+    evacuation_needed: bool
+
+
+@dataclass(slots=True)
+class MapVisualization(_Record):
+    """Ustawienia mapy dla punktów zalewu."""
+    center_lat: float
+    center_lng: float
+    zoom_level: int = 14
+    color_scale: str = 'Blues'
+    max_marker_size: int = 20
+
+
+@dataclass(slots=True)
+class FloodSimulationResult(_Record):
+    """
+    Wynik pojedynczego scenariusza FloodSim.
+    
+    Słownik w formacie JSON (to_dict) powstaje dopiero przy eksporcie;
+    flood_zones i visualization są obecne tylko dla detailed_output=True,
+    a sekcje pominięte przez argument fields simulate_scenario mają wartość None.
+    """
+    scenario_name: str
+    computation_time: str
+    parameters: Optional[FloodParameters] = None
+    hydraulic_conditions: Optional[HydraulicConditions] = None
+    metrics: Optional[FloodMetrics] = None
+    impact_assessment: Optional[ImpactAssessment] = None
+    flood_zones: Optional[FloodZones] = None
+    visualization: Optional[MapVisualization] = None
+    module: str = 'FloodSim'
+    model_version: str = 'FloodSim_v2.1_Suwalki'
+    
+    def __getitem__(self, key: str):
+        value = _Record.__getitem__(self, key)
+        if value is None:
+            # Sekcja pominięta - jak brak klucza w słowniku z to_dict
+            raise KeyError(key)
+        return value
+    
+    def keys(self) -> List[str]:
+        return list(self.to_dict())
+    
+    def to_dict(self) -> Dict:
+        result = {
+            'scenario_name': self.scenario_name,
+            'module': self.module,
+            'model_version': self.model_version,
+            'computation_time': self.computation_time
+        }
+        for section in ('parameters', 'hydraulic_conditions', 'metrics', 'impact_assessment'):
+            record = getattr(self, section)
+            if record is not None:
+                result[section] = record.to_dict()
+        if self.flood_zones is not None:
+            result['flood_zones'] = self.flood_zones
+            result['visualization'] = self.visualization.to_dict()
+        return result
+
+
+def _export_default(obj):
+    """Serializacja obiektów spoza JSON - rekordy wyników i FloodZones jako dict/lista, reszta jako str."""
+    if isinstance(obj, _Record):
+        return obj.to_dict()
+    if isinstance(obj, FloodZones):
+        return obj.to_records()
+    return str(obj)
+
+
+@functools.lru_cache(maxsize=256)
+def _generate_zones_cached(seed: int, num_zones: int, max_depth: float,
+                           center_lat: float, center_lng: float,
+                           base_elevation: float, max_flow_velocity: float) -> FloodZones:
+    """
+    Losuje punkty zalewu dla danego ziarna (wyniki zapamiętywane między wywołaniami).
+    
+    Tablice wyniku są tylko do odczytu, bo współdzieli je każde trafienie w cache.
+    """
+    lat, lng, depth, elevation, flow_velocity, surface_idx = _gen_zones(
+        np.random.default_rng(seed), num_zones, float(center_lat), float(center_lng),
+        float(base_elevation), float(max_depth), float(max_flow_velocity)
+    )
+
+    zones = FloodZones(
+        lat=np.round(lat, 6),
+        lng=np.round(lng, 6),
+        depth_m=np.round(depth, 3),
+        elevation_m=np.round(elevation, 1),
+        flow_velocity=np.round(flow_velocity, 2),
+        surface_code=surface_idx.astype(np.int8)
+    )
+    for column in (zones.lat, zones.lng, zones.depth_m, zones.elevation_m,
+                   zones.flow_velocity, zones.surface_code):
+        column.flags.writeable = False
+    return zones
+
+
 class FloodSimulator:
     """
     System symulacji powodzi 2D dla Suwałk.
@@ -54,10 +414,30 @@ class FloodSimulator:
         self.min_flow_depth = 0.01      # minimalna głębokość przepływu [m]
         self.max_flow_velocity = 5.0    # maksymalna prędkość przepływu [m/s]
         
-        print(f"🌊 FloodSim v2.1 initialized for {self.area_km2} km²")
-        print(f"   💧 Kanalizacja: {self.drainage_capacity} mm/h")
-        print(f"   🌱 Infiltracja: {self.infiltration_rate} mm/h") 
-        print(f"   🏘️ Zabudowa: {self.urban_coverage*100:.0f}%")
+        # Współczynniki kalibracyjne modelu zalewu (warunki miejskie)
+        self.depth_factor = 0.8         # głębokość [m] na 100 mm nadmiaru
+        self.area_factor = 1.2          # % powierzchni zalewanej na 1 mm nadmiaru
+        self.max_flood_depth = 3.0      # ograniczenie głębokości [m]
+        
+        # Dane GUS dla Suwałk - centrum miasta
+        self.buildings_per_km2 = 350    # budynki/km² w centrum
+        self.occupancy_rate = 0.6       # wskaźnik zajętości w strefie zalewu
+        self.residents_per_building = 3 # średnia liczba mieszkańców
+        
+        # Straty ekonomiczne (dane dla Polski)
+        self.damage_per_building = 50000        # PLN średnich strat na budynek
+        self.infrastructure_damage_rate = 10    # PLN/m³ wody
+        
+        # Stałe pochodne (niezmienne dla instancji)
+        self._depth_scale = self.depth_factor / 100
+        self._total_buildings = int(self.area_km2 * self.buildings_per_km2 * self.urban_coverage)
+        
+        logger.info("🌊 FloodSim v2.1 initialized for %s km²\n"
+                    "   💧 Kanalizacja: %s mm/h\n"
+                    "   🌱 Infiltracja: %s mm/h\n"
+                    "   🏘️ Zabudowa: %.0f%%",
+                    self.area_km2, self.drainage_capacity, self.infiltration_rate,
+                    self.urban_coverage * 100)
     
     def calculate_effective_rainfall(self, rainfall_mm_h: float, duration_h: float) -> Tuple[float, float, float]:
         """
@@ -98,37 +478,32 @@ class FloodSimulator:
         
         # Model potęgowy dla głębokości (kalibrowany dla warunków miejskich)
         # Uwzględnia naturalne zagłębienia, system drogowy jako kolektor
-        depth_factor = 0.8  # Współczynnik kalibracyjny
-        max_depth = min(total_excess_mm / 100 * depth_factor, 3.0)  # Ograniczenie do 3m
+        max_depth = min(total_excess_mm * self._depth_scale, self.max_flood_depth)
         
         # Procent powierzchni zalewany (model logistyczny)
-        area_factor = 1.2
-        flooded_area_pct = min(100, total_excess_mm * area_factor)
+        flooded_area_pct = min(100, total_excess_mm * self.area_factor)
         
         return max_depth, flooded_area_pct
     
-    def assess_flood_risk(self, max_depth: float) -> str:
+    def assess_flood_risk(self, max_depth: float) -> Tuple[str, int]:
         """
         Ocenia poziom ryzyka powodziowego według polskich standardów.
         
+        Progi głębokości (_RISK_THRESHOLDS):
+        - < 0.05 m: MINIMALNE (bez znaczącego zalewu)
+        - < 0.15 m: NISKIE (zalanie chodników)
+        - < 0.40 m: UMIARKOWANE (zalanie jezdni)
+        - < 0.80 m: WYSOKIE (zagrożenie dla samochodów)
+        - ≥ 0.80 m: KRYTYCZNE (zagrożenie dla życia)
+        
         Args:
             max_depth (float): Maksymalna głębokość zalewu [m]
             
         Returns:
-            str: Poziom ryzyka (MINIMALNE/NISKIE/UMIARKOWANE/WYSOKIE/KRYTYCZNE)
+            Tuple[str, int]: (poziom_ryzyka, risk_score 1-5)
         """
-        risk_levels = ["MINIMALNE", "NISKIE", "UMIARKOWANE", "WYSOKIE", "KRYTYCZNE"]
-        
-        if max_depth < 0.05:
-            return risk_levels[0]    # Bez znaczącego zalewu
-        elif max_depth < 0.15:
-            return risk_levels[1]    # Zalanie chodników
-        elif max_depth < 0.40:
-            return risk_levels[2]    # Zalanie jezdni
-        elif max_depth < 0.80:
-            return risk_levels[3]    # Zagrożenie dla samochodów
-        else:
-            return risk_levels[4]    # Zagrożenie dla życia
+        idx = bisect.bisect_right(_RISK_THRESHOLDS, max_depth)
+        return _RISK_LEVELS[idx], idx + 1
     
     def calculate_building_impact(self, flooded_area_km2: float) -> Dict[str, int]:
         """
@@ -140,20 +515,14 @@ class FloodSimulator:
         Returns:
             Dict[str, int]: Statystyki budynków (total, at_risk, affected_population)
         """
-        # Dane GUS dla Suwałk - centrum miasta
-        buildings_per_km2 = 350        # budynki/km² w centrum
-        occupancy_rate = 0.6          # wskaźnik zajętości w strefie zalewu
-        residents_per_building = 3    # średnia liczba mieszkańców
-        
-        total_buildings = int(self.area_km2 * buildings_per_km2 * self.urban_coverage)
         buildings_at_risk = min(
-            int(flooded_area_km2 * buildings_per_km2 * occupancy_rate), 
-            total_buildings
+            int(flooded_area_km2 * self.buildings_per_km2 * self.occupancy_rate), 
+            self._total_buildings
         )
-        affected_population = buildings_at_risk * residents_per_building
+        affected_population = buildings_at_risk * self.residents_per_building
         
         return {
-            "total": total_buildings,
+            "total": self._total_buildings,
             "at_risk": buildings_at_risk,
             "affected_population": affected_population
         }
@@ -169,21 +538,16 @@ class FloodSimulator:
         Returns:
             int: Szacowane straty w PLN
         """
-        # Średnie straty na budynek (dane dla Polski)
-        damage_per_building = 50000    # PLN
-        
-        # Straty infrastrukturalne (10 PLN/m³ wody)
-        infrastructure_damage_rate = 10  # PLN/m³
-        
-        total_damage = (buildings_at_risk * damage_per_building + 
-                       total_volume_m3 * infrastructure_damage_rate)
+        # Straty na budynkach + straty infrastrukturalne (od objętości wody)
+        total_damage = (buildings_at_risk * self.damage_per_building + 
+                       total_volume_m3 * self.infrastructure_damage_rate)
         
         return int(total_damage)
     
-    def generate_flood_zones(self, scenario_name: str, max_depth: float, 
-                           flooded_area_pct: float) -> List[Dict]:
+    def generate_flood_zones_soa(self, scenario_name: str, max_depth: float,
+                                 flooded_area_pct: float) -> FloodZones:
         """
-        Generuje punkty zalewu do wizualizacji na mapie.
+        Generuje punkty zalewu w układzie kolumnowym (SoA).
         
         Args:
             scenario_name (str): Nazwa scenariusza
@@ -191,52 +555,37 @@ class FloodSimulator:
             flooded_area_pct (float): Procent zalanego obszaru
             
         Returns:
-            List[Dict]: Lista punktów zalewu z współrzędnymi i parametrami
+            FloodZones: Kolumny punktów zalewu (tablice tylko do odczytu)
         """
-        # Deterministyczne generowanie punktów (powtarzalne wyniki)
-        seed_value = abs(hash(scenario_name)) % (2**31)
-        np.random.seed(seed_value)
-        
         # Liczba punktów proporcjonalna do obszaru zalewu
         num_zones = max(5, min(50, int(flooded_area_pct * 0.8)))
+
+        # Deterministyczne generowanie punktów (powtarzalne wyniki, także między procesami)
+        return _generate_zones_cached(
+            _stable_seed(scenario_name), num_zones, max_depth,
+            self.config['location']['center_lat'], self.config['location']['center_lng'],
+            self.base_elevation, self.max_flow_velocity
+        )
+    
+    def generate_flood_zones(self, scenario_name: str, max_depth: float, 
+                           flooded_area_pct: float) -> List[Dict]:
+        """
+        Generuje punkty zalewu do wizualizacji na mapie.
         
-        flood_zones = []
-        center_lat = self.config['location']['center_lat']
-        center_lng = self.config['location']['center_lng']
-        
-        for i in range(num_zones):
-            # Lokalizacja w okolicy centrum z rozkładem normalnym
-            lat = center_lat + np.random.normal(0, 0.008)  # ~±900m
-            lng = center_lng + np.random.normal(0, 0.012)  # ~±1200m
-            
-            # Głębokość z rozkładem wykładniczym (więcej płytkich zalewów)
-            if max_depth > 0:
-                depth = max(0.02, np.random.exponential(max_depth * 0.6))
-                depth = min(depth, max_depth)
-            else:
-                depth = 0.02
-            
-            # Prędkość przepływu (uproszczona formuła Manning-Strickler)
-            flow_velocity = min(np.sqrt(depth) * 1.5, self.max_flow_velocity) if depth > 0 else 0
-            
-            # Wysokość terenu (wartość bazowa ± wariacja)
-            elevation = self.base_elevation + np.random.normal(0, 2)
+        Args:
+            scenario_name (str): Nazwa scenariusza
+            max_depth (float): Maksymalna głębokość [m]
+            flooded_area_pct (float): Procent zalanego obszaru
             
-            flood_zones.append({
-                "lat": round(lat, 6),
-                "lng": round(lng, 6),
-                "depth_m": round(depth, 3),
-                "elevation_m": round(elevation, 1),
-                "flow_velocity": round(flow_velocity, 2),
-                "zone_id": i + 1,
-                "surface_type": np.random.choice(["road", "sidewalk", "green", "plaza"], 
-                                               p=[0.4, 0.25, 0.2, 0.15])
-            })
-        
-        return flood_zones
+        Returns:
+            List[Dict]: Lista punktów zalewu z współrzędnymi i parametrami
+        """
+        return self.generate_flood_zones_soa(scenario_name, max_depth, flooded_area_pct).to_records()
     
     def simulate_scenario(self, rainfall_mm_h: float, duration_h: float, 
-                         scenario_name: str, detailed_output: bool = True) -> Dict:
+                         scenario_name: str, detailed_output: bool = True,
+                         verbose: bool = True, fields: Optional[frozenset] = None,
+                         _timestamp: Optional[str] = None) -> FloodSimulationResult:
         """
         Główna funkcja symulująca scenariusz powodzi.
         
@@ -245,12 +594,22 @@ class FloodSimulator:
             duration_h (float): Czas trwania opadu [h]
             scenario_name (str): Nazwa scenariusza
             detailed_output (bool): Czy generować szczegółowe dane wyjściowe
+            verbose (bool): Czy logować przebieg symulacji (logger "floodsim", INFO)
+            fields (Optional[frozenset]): Sekcje wyniku do zbudowania ("parameters",
+                "hydraulic_conditions", "metrics", "impact_assessment"); None = wszystkie.
+                Ogranicza tylko składanie rekordów - hydrologia, wpływ na budynki
+                i straty liczone są zawsze (korzystają z nich logi i punkty zalewu)
+            _timestamp (Optional[str]): Wspólny znacznik czasu ISO (ustawiany przez batch)
             
         Returns:
-            Dict: Kompletne wyniki symulacji
+            FloodSimulationResult: Kompletne wyniki symulacji (to_dict() daje format JSON)
+            
+        Raises:
+            ValueError: Gdy fields zawiera nieznaną nazwę sekcji
         """
-        print(f"\n🌊 FloodSim: {scenario_name}")
-        print(f"   🌧️ Opad: {rainfall_mm_h} mm/h przez {duration_h}h")
+        if fields is not None and not _RESULT_SECTIONS.issuperset(fields):
+            raise ValueError(f"Nieznane sekcje wyniku: {sorted(set(fields) - _RESULT_SECTIONS)}; "
+                             f"dostępne: {sorted(_RESULT_SECTIONS)}")
         
         # Obliczenia hydrologiczne
         effective_rainfall, excess_rainfall, total_excess_mm = \
@@ -261,7 +620,7 @@ class FloodSimulator:
         flooded_area_km2 = (flooded_area_pct / 100) * self.area_km2
         
         # Ocena ryzyka
-        risk_level = self.assess_flood_risk(max_depth)
+        risk_level, risk_score = self.assess_flood_risk(max_depth)
         
         # Wpływ na budynki
         building_impact = self.calculate_building_impact(flooded_area_km2)
@@ -274,98 +633,240 @@ class FloodSimulator:
             building_impact["at_risk"], total_volume_m3
         )
         
-        # Punkty zalewu do wizualizacji
-        flood_zones = []
-        if detailed_output:
-            flood_zones = self.generate_flood_zones(scenario_name, max_depth, flooded_area_pct)
+        result = self._build_result(
+            scenario_name, rainfall_mm_h, duration_h, effective_rainfall, excess_rainfall,
+            max_depth, flooded_area_pct, flooded_area_km2, total_volume_m3,
+            risk_level, risk_score, building_impact, economic_damage, detailed_output,
+            _timestamp or datetime.now().isoformat(), fields
+        )
         
-        # Strukturyzacja wyników
-        result = {
-            'scenario_name': scenario_name,
-            'module': 'FloodSim',
-            'model_version': 'FloodSim_v2.1_Suwalki',
-            'computation_time': datetime.now().isoformat(),
-            
-            'parameters': {
-                'rainfall_mm_h': rainfall_mm_h,
-                'duration_h': duration_h,
-                'total_rainfall_mm': rainfall_mm_h * duration_h,
-                'effective_rainfall_mm': effective_rainfall * duration_h,
-                'excess_rainfall_mm': excess_rainfall * duration_h,
-                'runoff_coefficient': self.runoff_coefficient
-            },
-            
-            'hydraulic_conditions': {
-                'drainage_capacity_mm_h': self.drainage_capacity,
-                'infiltration_rate_mm_h': self.infiltration_rate,
-                'manning_roughness': self.manning_n,
-                'urban_coverage_percent': self.urban_coverage * 100
-            },
-            
-            'metrics': {
-                'max_depth_m': round(max_depth, 3),
-                'mean_depth_m': round(max_depth * 0.4, 3),
-                'flooded_area_km2': round(flooded_area_km2, 4),
-                'flooded_area_percent': round(flooded_area_pct, 1),
-                'total_volume_m3': round(total_volume_m3, 0),
-                'peak_flow_velocity_ms': round(np.sqrt(max_depth) * 1.5 if max_depth > 0 else 0, 2),
-                'risk_level': risk_level,
-                'risk_score': len(["MINIMALNE", "NISKIE", "UMIARKOWANE", "WYSOKIE", "KRYTYCZNE"][:
-                                ["MINIMALNE", "NISKIE", "UMIARKOWANE", "WYSOKIE", "KRYTYCZNE"].index(risk_level)+1])
-            },
-            
-            'impact_assessment': {
-                'buildings_total': building_impact["total"],
-                'buildings_at_risk': building_impact["at_risk"],
-                'affected_population': building_impact["affected_population"],
-                'economic_damage_pln': economic_damage,
-                'economic_damage_eur': round(economic_damage / 4.5, 0),  # PLN->EUR
-                'evacuation_needed': max_depth > 0.5
-            }
-        }
+        # Logi wynikowe
+        if verbose and logger.isEnabledFor(logging.INFO):
+            logger.info(
+                f"🌊 FloodSim: {scenario_name}\n"
+                f"   🌧️ Opad: {rainfall_mm_h} mm/h przez {duration_h}h\n"
+                f"   📊 Max głębokość: {max_depth:.3f}m\n"
+                f"   📍 Obszar zalewu: {flooded_area_km2:.3f} km² ({flooded_area_pct:.1f}%)\n"
+                f"   🏠 Budynki zagrożone: {building_impact['at_risk']}\n"
+                f"   👥 Ludność dotknięta: {building_impact['affected_population']}\n"
+                f"   💰 Straty: {economic_damage:,} PLN\n"
+                f"   ⚠️ Ryzyko: {risk_level}"
+            )
         
-        # Dodaj punkty zalewu jeśli wymagane
+        return result
+    
+    def _build_result(self, scenario_name: str, rainfall_mm_h: float, duration_h: float,
+                      effective_rainfall: float, excess_rainfall: float, max_depth: float,
+                      flooded_area_pct: float, flooded_area_km2: float, total_volume_m3: float,
+                      risk_level: str, risk_score: int, building_impact: Dict[str, int],
+                      economic_damage: int, detailed_output: bool, timestamp: str,
+                      fields: Optional[frozenset] = None) -> FloodSimulationResult:
+        """
+        Składa wynik scenariusza z policzonych wielkości hydrologicznych.
+        
+        Wspólne dla simulate_scenario i batch_simulate_vec.
+        
+        Returns:
+            FloodSimulationResult: Kompletne wyniki symulacji
+        """
+        # Punkty zalewu do wizualizacji (kolumnowo; słowniki powstają przy eksporcie)
+        flood_zones = None
         if detailed_output:
-            result['flood_zones'] = flood_zones
-            result['visualization'] = {
-                'center_lat': self.config['location']['center_lat'],
-                'center_lng': self.config['location']['center_lng'],
-                'zoom_level': 14,
-                'color_scale': 'Blues',
-                'max_marker_size': 20
-            }
+            flood_zones = self.generate_flood_zones_soa(scenario_name, max_depth, flooded_area_pct)
+        
+        # Strukturyzacja wyników (tylko sekcje wybrane przez fields)
+        result = FloodSimulationResult(scenario_name=scenario_name, computation_time=timestamp)
+        
+        if fields is None or 'parameters' in fields:
+            result.parameters = FloodParameters(
+                rainfall_mm_h=rainfall_mm_h,
+                duration_h=duration_h,
+                total_rainfall_mm=rainfall_mm_h * duration_h,
+                effective_rainfall_mm=effective_rainfall * duration_h,
+                excess_rainfall_mm=excess_rainfall * duration_h,
+                runoff_coefficient=self.runoff_coefficient
+            )
+        
+        if fields is None or 'hydraulic_conditions' in fields:
+            result.hydraulic_conditions = HydraulicConditions(
+                drainage_capacity_mm_h=self.drainage_capacity,
+                infiltration_rate_mm_h=self.infiltration_rate,
+                manning_roughness=self.manning_n,
+                urban_coverage_percent=self.urban_coverage * 100
+            )
+        
+        if fields is None or 'metrics' in fields:
+            result.metrics = FloodMetrics(
+                max_depth_m=round(max_depth, 3),
+                mean_depth_m=round(max_depth * 0.4, 3),
+                flooded_area_km2=round(flooded_area_km2, 4),
+                flooded_area_percent=round(flooded_area_pct, 1),
+                total_volume_m3=round(total_volume_m3, 0),
+                peak_flow_velocity_ms=round(math.sqrt(max_depth) * 1.5 if max_depth > 0 else 0, 2),
+                risk_level=risk_level,
+                risk_score=risk_score
+            )
+        
+        if fields is None or 'impact_assessment' in fields:
+            result.impact_assessment = ImpactAssessment(
+                buildings_total=building_impact["total"],
+                buildings_at_risk=building_impact["at_risk"],
+                affected_population=building_impact["affected_population"],
+                economic_damage_pln=economic_damage,
+                economic_damage_eur=round(economic_damage / 4.5, 0),  # PLN->EUR
+                evacuation_needed=max_depth > 0.5
+            )
         
-        # Logi wynikowe
-        print(f"   📊 Max głębokość: {max_depth:.3f}m")
-        print(f"   📍 Obszar zalewu: {flooded_area_km2:.3f} km² ({flooded_area_pct:.1f}%)")  
-        print(f"   🏠 Budynki zagrożone: {building_impact['at_risk']}")
-        print(f"   👥 Ludność dotknięta: {building_impact['affected_population']}")
-        print(f"   💰 Straty: {economic_damage:,} PLN")
-        print(f"   ⚠️ Ryzyko: {risk_level}")
+        # Dodaj punkty zalewu jeśli wymagane
+        if detailed_output:
+            result.flood_zones = flood_zones
+            result.visualization = MapVisualization(
+                center_lat=self.config['location']['center_lat'],
+                center_lng=self.config['location']['center_lng']
+            )
         
         return result
     
-    def batch_simulate(self, scenarios: List[Tuple[float, float, str]]) -> Dict[str, Dict]:
+    def batch_simulate(self, scenarios: List[Tuple[float, float, str]],
+                       detailed_output: bool = True,
+                       verbose: bool = False) -> Dict[str, FloodSimulationResult]:
         """
         Uruchamia batch symulacji dla wielu scenariuszy.
         
         Args:
             scenarios (List[Tuple]): Lista (rainfall, duration, name)
+            detailed_output (bool): Czy generować punkty zalewu (False dla przeglądów parametrów)
+            verbose (bool): Czy logować wyniki poszczególnych scenariuszy
             
         Returns:
-            Dict[str, Dict]: Wyniki wszystkich scenariuszy
+            Dict[str, FloodSimulationResult]: Wyniki wszystkich scenariuszy
         """
         results = {}
         
-        print(f"\n🔄 Batch simulation: {len(scenarios)} scenarios")
+        logger.info("🔄 Batch simulation: %d scenarios", len(scenarios))
+        
+        # Jeden znacznik czasu dla całego batcha
+        timestamp = datetime.now().isoformat()
         
         for i, (rainfall, duration, name) in enumerate(scenarios, 1):
-            print(f"\n[{i}/{len(scenarios)}]", end=" ")
-            result = self.simulate_scenario(rainfall, duration, name)
+            if verbose:
+                logger.info("[%d/%d]", i, len(scenarios))
+            result = self.simulate_scenario(rainfall, duration, name, detailed_output,
+                                            verbose=verbose, _timestamp=timestamp)
             key = name.lower().replace(" ", "_")
             results[key] = result
         
-        print(f"\n✅ Batch completed: {len(results)} scenarios")
+        logger.info("✅ Batch completed: %d scenarios", len(results))
+        return results
+    
+    def batch_simulate_vec(self, rainfalls: np.ndarray, durations: np.ndarray,
+                           names: List[str], detailed_output: bool = True) -> Dict[str, FloodSimulationResult]:
+        """
+        Wektorowy wariant batch_simulate dla przeglądów parametrów.
+        
+        Hydrologia, zasięg zalewu, wpływ na budynki i straty liczone są jednym
+        przebiegiem po tablicach NumPy; pętla po scenariuszach składa tylko
+        słowniki wyników (i ewentualnie punkty zalewu).
+        
+        Args:
+            rainfalls (np.ndarray): Intensywności opadu [mm/h]
+            durations (np.ndarray): Czasy trwania opadu [h]
+            names (List[str]): Nazwy scenariuszy
+            detailed_output (bool): Czy generować punkty zalewu
+            
+        Returns:
+            Dict[str, FloodSimulationResult]: Wyniki wszystkich scenariuszy (jak batch_simulate)
+            
+        Raises:
+            ValueError: Gdy tablice wejściowe i lista nazw mają różne długości
+        """
+        rainfalls = np.asarray(rainfalls)
+        durations = np.asarray(durations)
+        if not len(names) == rainfalls.size == durations.size:
+            raise ValueError(f"Niezgodne długości wejścia: {len(names)} nazw, {rainfalls.size} opadów, "
+                             f"{durations.size} czasów trwania")
+        
+        logger.info("🔄 Vectorized batch simulation: %d scenarios", len(names))
+        
+        # Obliczenia hydrologiczne (calculate_effective_rainfall)
+        effective = np.maximum(0, rainfalls - self.infiltration_rate)
+        excess = np.maximum(0, effective - self.drainage_capacity)
+        total_excess = excess * durations * self.runoff_coefficient
+        
+        # Głębokość i zasięg (calculate_flood_depths)
+        flooded = total_excess > 0
+        max_depth = np.where(flooded, np.minimum(total_excess * self._depth_scale, self.max_flood_depth), 0.0)
+        flooded_area_pct = np.where(flooded, np.minimum(100, total_excess * self.area_factor), 0.0)
+        flooded_area_km2 = (flooded_area_pct / 100) * self.area_km2
+        
+        # Wpływ na budynki (calculate_building_impact)
+        total_buildings = self._total_buildings
+        at_risk = np.minimum(
+            (flooded_area_km2 * self.buildings_per_km2 * self.occupancy_rate).astype(np.int64),
+            total_buildings
+        )
+        
+        # Objętość wody i straty (calculate_economic_damage)
+        total_volume = flooded_area_km2 * 1e6 * (max_depth * 0.4)
+        damage = (at_risk * self.damage_per_building +
+                  total_volume * self.infrastructure_damage_rate).astype(np.int64)
+        
+        # Ocena ryzyka (assess_flood_risk)
+        risk_idx = np.searchsorted(_RISK_THRESHOLDS, max_depth, side='right')
+        
+        timestamp = datetime.now().isoformat()
+        results = {}
+        for row in zip(names, rainfalls.tolist(), durations.tolist(), effective.tolist(),
+                       excess.tolist(), max_depth.tolist(), flooded_area_pct.tolist(),
+                       flooded_area_km2.tolist(), total_volume.tolist(),
+                       at_risk.tolist(), damage.tolist(), risk_idx.tolist()):
+            (name, rainfall, duration, eff, exc, depth, area_pct,
+             area_km2, volume, buildings_at_risk, economic_damage, risk) = row
+            building_impact = {
+                "total": total_buildings,
+                "at_risk": buildings_at_risk,
+                "affected_population": buildings_at_risk * self.residents_per_building
+            }
+            key = name.lower().replace(" ", "_")
+            results[key] = self._build_result(
+                name, rainfall, duration, eff, exc, depth, area_pct, area_km2, volume,
+                _RISK_LEVELS[risk], risk + 1, building_impact, economic_damage, detailed_output,
+                timestamp
+            )
+        
+        logger.info("✅ Vectorized batch completed: %d scenarios", len(results))
+        return results
+    
+    def batch_simulate_parallel(self, scenarios: List[Tuple[float, float, str]],
+                                workers: Optional[int] = None,
+                                detailed_output: bool = True) -> Dict[str, FloodSimulationResult]:
+        """
+        Uruchamia batch symulacji równolegle w puli procesów.
+        
+        Scenariusze są niezależne, więc każdy liczony jest w osobnym procesie;
+        logi per scenariusz są wyłączone, podsumowanie loguje proces główny.
+        
+        Args:
+            scenarios (List[Tuple]): Lista (rainfall, duration, name)
+            workers (Optional[int]): Liczba procesów (domyślnie os.cpu_count())
+            detailed_output (bool): Czy generować punkty zalewu
+            
+        Returns:
+            Dict[str, FloodSimulationResult]: Wyniki wszystkich scenariuszy (jak batch_simulate)
+        """
+        results = {}
+        
+        logger.info("🔄 Parallel batch simulation: %d scenarios", len(scenarios))
+        
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+            run = functools.partial(_run_scenario, self, detailed_output=detailed_output,
+                                    timestamp=datetime.now().isoformat())
+            outputs = executor.map(run, scenarios)
+            for (_, _, name), result in zip(scenarios, outputs):
+                key = name.lower().replace(" ", "_")
+                results[key] = result
+        
+        logger.info("✅ Parallel batch completed: %d scenarios", len(results))
         return results
     
     def export_results(self, results: Dict, output_file: str = "flood_results.json"):
@@ -393,13 +894,31 @@ class FloodSimulator:
             "results": results
         }
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(export_data, f, indent=2, ensure_ascii=False, default=str)
+        if orjson is not None:
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(
+                    export_data, default=_export_default,
+                    option=(orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS |
+                            orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATACLASS)
+                ))
+        else:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                json.dump(export_data, f, indent=2, ensure_ascii=False, default=_export_default)
         
-        print(f"💾 Results exported to: {output_file}")
+        logger.info("💾 Results exported to: %s", output_file)
+
+def _run_scenario(simulator: "FloodSimulator", scenario: Tuple[float, float, str],
+                  detailed_output: bool = True, timestamp: Optional[str] = None) -> FloodSimulationResult:
+    """Uruchamia pojedynczy scenariusz bez logów (funkcja modułowa - picklowalna dla puli procesów)."""
+    rainfall, duration, name = scenario
+    return simulator.simulate_scenario(rainfall, duration, name, detailed_output,
+                                       verbose=False, _timestamp=timestamp)
+
 
 # Przykłady użycia
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     # Przykładowa konfiguracja dla testów
     test_config = {
         'location': {
@@ -424,5 +943,5 @@ if __name__ == "__main__":
         (150, 1, "Ekstremalna nawałnica")
     ]
     
-    batch_results = flood_sim.batch_simulate(scenarios)
+    batch_results = flood_sim.batch_simulate(scenarios, verbose=True)
     flood_sim.export_results(batch_results, "flood_batch_results.json")
\ No newline at end of file
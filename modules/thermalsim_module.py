@@ -11,11 +11,541 @@ Data: Wrzesień 2025
 """
 
 import numpy as np
+from dataclasses import dataclass, fields
 from datetime import datetime
+from enum import IntEnum
+from concurrent.futures import ProcessPoolExecutor
+import bisect
+from functools import cached_property, partial
+from types import SimpleNamespace
+import hashlib
 import json
-from typing import Dict, List, Tuple, Optional
+import os
+from typing import Dict, Iterator, List, Tuple, Optional, Union
 import math
 
+try:
+    from pythermalcomfort.models import pmv_ppd as _pmv_ppd, utci as _utci
+    _HAS_PTC = True
+except ImportError:
+    # Brak pythermalcomfort - PMV/PPD/UTCI z uproszczonych implementacji
+    _HAS_PTC = False
+
+try:
+    import numexpr as ne
+except ImportError:
+    # numexpr opcjonalny - bez niego wyrażenia tablicowe liczone są w NumPy
+    ne = None
+
+try:
+    from numba import njit
+    _HAS_NUMBA = True
+except ImportError:
+    # Numba opcjonalna - bez niej kernele działają jako zwykłe funkcje Pythona
+    _HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+class Surface(IntEnum):
+    """Typy powierzchni - kody indeksujące tablice _ABSORPTION i _IS_HARD."""
+    URBAN = 0
+    GRASS = 1
+    WATER = 2
+    ASPHALT = 3
+    ROOF = 4
+    CONCRETE = 5
+    
+    @property
+    def label(self) -> str:
+        """Nazwa typu powierzchni używana w eksporcie JSON (np. "urban")."""
+        return self.name.lower()
+
+
+# Współczynniki absorpcji słonecznej dla różnych powierzchni (indeks = Surface)
+_ABSORPTION = np.array([
+    0.06,     # URBAN - beton, cegła - średnia absorpcja
+    0.02,     # GRASS - zieleń - niska absorpcja, wysoka ewapotranspiracja
+    0.01,     # WATER - bardzo niska absorpcja, wysoka pojemność cieplna
+    0.08,     # ASPHALT - wysoka absorpcja
+    0.07,     # ROOF - dachy - średnia/wysoka absorpcja
+    0.065     # CONCRETE - beton - średnia absorpcja
+])
+
+# Powierzchnie utwardzone - dodatkowy radiacyjny efekt miejskiej wyspy ciepła
+_IS_HARD = np.array([True, False, False, True, False, True])
+
+
+def _zone_surface(zone: Dict) -> Tuple[float, bool, str]:
+    """
+    Parametry powierzchni strefy: absorpcja, czy utwardzona, nazwa do eksportu.
+    
+    Strefa podaje kod "surface_code" (Surface) albo, jak w pierwotnym formacie
+    słownika, nazwę "surface_type" ("asphalt", "grass", ...). Nieznana nazwa
+    daje średnią absorpcję bez efektu UHI (jak estimate_mean_radiant_temperature).
+    
+    Args:
+        zone (Dict): Definicja strefy miejskiej
+        
+    Returns:
+        Tuple[float, bool, str]: (absorpcja, powierzchnia utwardzona, typ powierzchni)
+    """
+    code = zone.get("surface_code")
+    if code is None:
+        surface_type = zone["surface_type"]
+        if isinstance(surface_type, Surface):
+            code = surface_type
+        else:
+            code = Surface.__members__.get(surface_type.upper())
+            if code is None:
+                return 0.05, False, surface_type
+    code = Surface(code)
+    return float(_ABSORPTION[code]), bool(_IS_HARD[code]), code.label
+
+
+# Klasy stresu termicznego wg temperatury powietrza [°C]
+_STRESS_BINS = np.array([-10, 0, 18, 26, 32, 38])
+_STRESS_LABELS = np.array(["extreme_cold", "cold", "cool", "comfortable", "warm", "hot", "extreme_heat"])
+
+# Poziomy komfortu wg |PMV| (skala 5-stopniowa)
+_PMV_BINS = (0.5, 1.0, 1.5, 2.0)
+_COMFORT_LABELS = ("DOSKONAŁY", "DOBRY", "AKCEPTOWALNY", "SŁABY", "NIEAKCEPTOWALNY")
+_COMFORT_SCORES = (5, 4, 3, 2, 1)
+
+# Rekomendacje adaptacyjne wg PMV (od zimna do gorąca)
+_RECOMMENDATION_BINS = (-2.0, -1.0, -0.5, 0.5, 1.0, 2.0)
+_RECOMMENDATIONS = (
+    "Ochrona przed wiatrem, ciepłe ubranie, aktywność fizyczna",
+    "Dodatkowa warstwa odzieży, ograniczenie czasu ekspozycji",
+    "Lekka korekta ubioru, generalnie komfortowe warunki",
+    "Optymalne warunki komfortu termicznego",
+    "Komfortowe warunki, możliwe dłuższe przebywanie",
+    "Krótkie przebywanie, częste przerwy w cieniu, nawodnienie",
+    "Unikać ekspozycji 10:00-18:00, szukać cienia, nawodnienie"
+)
+
+
+def _stable_hash(text: str) -> int:
+    """Hash tekstu niezależny od procesu (wbudowany hash() jest solony per proces)."""
+    return int.from_bytes(hashlib.blake2s(text.encode(), digest_size=4).digest(), 'little')
+
+
+def _round_np(value: float, decimals: int) -> float:
+    """
+    round() z semantyką np.float64 (rint(x * 10^n) / 10^n) zamiast dziesiętnej.
+    
+    Pierwotne wskaźniki PMV/PPD/PET (i UTCI z korektą wiatrową) były np.float64,
+    więc na granicach .x5 zaokrąglały się jak NumPy - kernele zwracają float.
+    """
+    return float(np.round(value, decimals))
+
+
+class _Record:
+    """
+    Wspólny interfejs rekordów wyników: odczyt jak ze słownika i konwersja do dict.
+    
+    Rekordy zastępują dawne zagnieżdżone słowniki, więc obsługują protokół
+    mapowania tylko do odczytu (zone['comfort_indices']['pmv'], 'pmv' in ..., get, keys,
+    items, iteracja, len). Nie są jednak instancjami dict - json.dumps wymaga
+    default=_export_default (tak eksportuje export_results).
+    """
+    __slots__ = ()
+    
+    def __getitem__(self, key: str):
+        try:
+            return getattr(self, key)
+        except (AttributeError, TypeError):
+            raise KeyError(key) from None
+    
+    def keys(self) -> List[str]:
+        return [f.name for f in fields(self)]
+    
+    def values(self) -> List:
+        return [getattr(self, key) for key in self.keys()]
+    
+    def items(self) -> List[Tuple]:
+        return [(key, getattr(self, key)) for key in self.keys()]
+    
+    def get(self, key: str, default=None):
+        return getattr(self, key) if key in self else default
+    
+    def __contains__(self, key) -> bool:
+        return key in self.keys()
+    
+    def __iter__(self):
+        return iter(self.keys())
+    
+    def __len__(self) -> int:
+        return len(self.keys())
+    
+    def to_dict(self) -> Dict:
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+
+@dataclass(slots=True)
+class ZoneMicroclimate(_Record):
+    """Lokalne warunki mikroklimatu strefy."""
+    air_temp: float
+    mean_radiant_temp: float
+    wind_speed: float
+    humidity: float
+    surface_type: str
+
+
+@dataclass(slots=True)
+class ComfortIndices(_Record):
+    """Wskaźniki komfortu termicznego (PMV, PPD, UTCI, PET)."""
+    pmv: float
+    ppd: float
+    utci: float
+    pet: float
+
+
+@dataclass(slots=True)
+class ComfortAssessment(_Record):
+    """Ocena komfortu strefy i rekomendacja adaptacyjna."""
+    comfort_level: str
+    comfort_score: int
+    recommendation: str
+    thermal_stress: str
+
+
+@dataclass(slots=True)
+class ZoneComfort(_Record):
+    """Wynik analizy komfortu dla jednej strefy miejskiej."""
+    zone_name: str
+    area_percent: float
+    microclimate: ZoneMicroclimate
+    comfort_indices: ComfortIndices
+    assessment: ComfortAssessment
+
+
+@dataclass(slots=True)
+class ComfortPoint(_Record):
+    """Punkt mapy komfortu termicznego."""
+    lat: float
+    lng: float
+    pmv: float
+    ppd: float
+    utci: float
+    pet: float
+    zone_type: str
+    surface_temp: float
+    comfort_score: int
+    microenvironment: str
+
+
+# Punkty mapy komfortu - tablica strukturalna, pola w kolejności eksportu JSON.
+# Współrzędne w float64 (6 miejsc po przecinku), wskaźniki w float32.
+_COMFORT_POINT_DTYPE = np.dtype([
+    ('lat', 'f8'),
+    ('lng', 'f8'),
+    ('pmv', 'f4'),
+    ('ppd', 'f4'),
+    ('utci', 'f4'),
+    ('pet', 'f4'),
+    ('zone_type', 'U24'),
+    ('surface_temp', 'f4'),
+    ('comfort_score', 'i1'),
+    ('microenvironment', 'U16')
+])
+
+# Precyzja eksportu pól float32 (liczba miejsc po przecinku)
+_COMFORT_POINT_DECIMALS = {'pmv': 2, 'ppd': 1, 'utci': 1, 'pet': 1, 'surface_temp': 1}
+
+
+def _iter_comfort_points(points: np.ndarray) -> Iterator[Dict]:
+    """Leniwie zamienia tablicę strukturalną punktów na słowniki (format JSON comfort_map)."""
+    names = points.dtype.names
+    columns = []
+    for name in names:
+        column = points[name]
+        if column.dtype == np.float32:
+            # float32 -> float64 i ponowne zaokrąglenie, żeby w JSON nie było ogonów (0.3499999940...)
+            column = np.round(column.astype(np.float64), _COMFORT_POINT_DECIMALS[name])
+        columns.append(column.tolist())
+    for row in zip(*columns):
+        yield dict(zip(names, row))
+
+
+def _comfort_points_to_records(points: np.ndarray) -> List[Dict]:
+    """Zamienia tablicę strukturalną punktów na listę słowników (format JSON comfort_map)."""
+    return list(_iter_comfort_points(points))
+
+
+def _export_default(obj):
+    """Serializacja obiektów spoza JSON - rekordy wyników jako dict, punkty komfortu jako lista, reszta jako str."""
+    if isinstance(obj, _Record):
+        return obj.to_dict()
+    if isinstance(obj, np.ndarray) and obj.dtype.names:
+        return _comfort_points_to_records(obj)
+    return str(obj)
+
+
+# Ciśnienie nasycenia pary wodnej (Magnus) stablicowane co 0.1°C dla typowych
+# temperatur miejskich; poza zakresem tablicy liczone dokładnie.
+_ES_TA_GRID = np.linspace(-30.0, 45.0, 751)
+_ES_TABLE = 610.78 * np.exp(17.27 * _ES_TA_GRID / (_ES_TA_GRID + 237.3))
+_ES_TA_MIN = -30.0
+_ES_TA_MAX = 45.0
+_ES_STEPS_PER_DEG = 10.0
+
+
+def _saturation_pressure_np(ta: np.ndarray) -> np.ndarray:
+    """Ciśnienie nasycenia [Pa] dla tablicy temperatur - interpolacja w tablicy, dokładnie poza nią."""
+    es = np.interp(ta, _ES_TA_GRID, _ES_TABLE)
+    outside = (ta < _ES_TA_MIN) | (ta > _ES_TA_MAX)
+    if outside.any():
+        t = ta[outside]
+        es[outside] = 610.78 * np.exp(17.27 * t / (t + 237.3))
+    return es
+
+
+# Kernele numeryczne (skalarne, math.*) - kompilowane numbą gdy jest dostępna.
+# Metody ThermalComfortSimulator są cienkimi opakowaniami na te funkcje.
+# Bez fastmath - wyniki są zaokrąglane i eksportowane, a przestawianie działań
+# zmienia je na granicach zaokrągleń (np. PMV -2.0 -> -1.99).
+
+@njit(cache=True)
+def _saturation_pressure(ta):
+    """Ciśnienie nasycenia pary wodnej [Pa] (Magnus) - tablica z interpolacją liniową w [-30, 45]°C."""
+    if ta < _ES_TA_MIN or ta > _ES_TA_MAX:
+        return 610.78 * math.exp(17.27 * ta / (ta + 237.3))
+    x = (ta - _ES_TA_MIN) * _ES_STEPS_PER_DEG
+    i = min(int(x), _ES_TABLE.shape[0] - 2)
+    frac = x - i
+    return _ES_TABLE[i] * (1.0 - frac) + _ES_TABLE[i + 1] * frac
+
+
+@njit(cache=True)
+def _pmv_kernel(ta, tr, va, rh, met, clo, pa, sb):
+    """
+    Rdzeń PMV (model Fangera, ISO 7730) dla pojedynczego punktu.
+    
+    Args:
+        ta, tr, va, rh (float): Parametry środowiska jak w calculate_pmv_detailed
+        met, clo (float): Aktywność metaboliczna [met] i izolacyjność odzieży [clo]
+        pa (float): Ciśnienie parcjalne pary [Pa]; wartość ujemna = licz z rh
+        sb (float): Stała Stefana-Boltzmanna
+        
+    Returns:
+        float: PMV [-3.0 do +3.0]
+    """
+    ta_k = ta + 273.15
+    tr_k = tr + 273.15
+    
+    if pa < 0.0:
+        pa = rh / 100 * _saturation_pressure(ta)
+    
+    M = met * 58.15
+    W = 0.0
+    Icl = clo * 0.155
+    if Icl <= 0.078:
+        fcl = 1.0 + 1.290 * Icl
+    else:
+        fcl = 1.05 + 0.645 * Icl
+    
+    # Niezmienniki iteracji
+    MW = M - W
+    Icl_fcl = Icl * fcl
+    hc_forced = 12.1 * math.sqrt(va)
+    four_sb_fcl = 4 * sb * fcl
+    
+    tcl = ta
+    tcl_k = ta_k
+    hc = hc_forced
+    for _ in range(10):
+        hc = max(2.38 * abs(tcl - ta)**0.25, hc_forced) if va < 0.1 else hc_forced
+        hr = four_sb_fcl * ((tcl_k + tr_k) * 0.5)**3
+        
+        tcl_new = (Icl_fcl * MW + fcl * hr * tr_k + fcl * hc * ta + ta_k) / (1 + Icl_fcl * (hr + hc)) - 273.15
+        converged = abs(tcl_new - tcl) < 1e-4
+        tcl = tcl_new
+        tcl_k = tcl + 273.15
+        if converged:  # Zwykle zbiega po 3-4 iteracjach
+            break
+    
+    tcl_k = tcl + 273.15
+    
+    HL1 = 3.05 * 0.001 * (5733 - 6.99 * MW - pa)
+    HL2 = 0.42 * (MW - 58.15) if MW > 58.15 else 0.0
+    HL3 = 1.7 * 0.00001 * M * (5867 - pa)
+    HL4 = 0.0014 * M * (34 - ta)
+    HL5 = 3.96 * fcl * (tcl_k**4 - tr_k**4)
+    HL6 = fcl * hc * (tcl - ta)
+    
+    thermal_load = MW - HL1 - HL2 - HL3 - HL4 - HL5 - HL6
+    pmv = (0.303 * math.exp(-0.036 * M) + 0.028) * thermal_load
+    
+    return max(-3.0, min(3.0, pmv))
+
+
+@njit(cache=True)
+def _pmv_batch_kernel(ta, tr, va, rh, met, clo, pa, sb):
+    """PMV dla tablic 1-D (pętla po punktach)."""
+    out = np.empty(ta.shape[0])
+    for i in range(ta.shape[0]):
+        out[i] = _pmv_kernel(ta[i], tr[i], va[i], rh[i], met, clo, pa[i], sb)
+    return out
+
+
+def _pmv_detailed_np(ta, tr, va, rh, met, clo, pa, sb):
+    """
+    Wektorowe PMV w czystym NumPy (broadcasting) - ścieżka bez numby.
+    
+    Returns:
+        np.ndarray: PMV dla wszystkich punktów
+    """
+    ta_k = ta + 273.15
+    tr_k = tr + 273.15
+    
+    if pa is None:
+        pa = rh / 100 * _saturation_pressure_np(ta)
+    
+    M = met * 58.15
+    W = 0
+    Icl = clo * 0.155
+    fcl = 1.0 + 1.290 * Icl if Icl <= 0.078 else 1.05 + 0.645 * Icl
+    
+    # Niezmienniki iteracji
+    MW = M - W
+    Icl_fcl = Icl * fcl
+    hc_forced = 12.1 * np.sqrt(va)
+    four_sb_fcl = 4 * sb * fcl
+    still_air = va < 0.1
+    
+    tcl = ta
+    tcl_k = ta_k
+    hc = hc_forced
+    for _ in range(10):
+        hc = np.where(still_air, np.maximum(2.38 * np.abs(tcl - ta)**0.25, hc_forced), hc_forced)
+        hr = four_sb_fcl * ((tcl_k + tr_k) * 0.5)**3
+        
+        if ne is not None:
+            # Jeden przebieg bez tablic pośrednich
+            tcl_new = ne.evaluate("(Icl_fcl * MW + fcl * hr * tr_k + fcl * hc * ta + ta_k)"
+                                  " / (1 + Icl_fcl * (hr + hc)) - 273.15")
+        else:
+            tcl_new = (Icl_fcl * MW + fcl * hr * tr_k + fcl * hc * ta + ta_k) / (1 + Icl_fcl * (hr + hc)) - 273.15
+        converged = np.all(np.abs(tcl_new - tcl) < 1e-4)
+        tcl = tcl_new
+        tcl_k = tcl + 273.15
+        if converged:
+            break
+    
+    HL1 = 3.05 * 0.001 * (5733 - 6.99 * MW - pa)
+    HL2 = 0.42 * (MW - 58.15) if MW > 58.15 else 0
+    HL3 = 1.7 * 0.00001 * M * (5867 - pa)
+    HL4 = 0.0014 * M * (34 - ta)
+    HL5 = 3.96 * fcl * (tcl_k**4 - tr_k**4)
+    HL6 = fcl * hc * (tcl - ta)
+    
+    thermal_load = MW - HL1 - HL2 - HL3 - HL4 - HL5 - HL6
+    return np.clip((0.303 * math.exp(-0.036 * M) + 0.028) * thermal_load, -3.0, 3.0)
+
+
+@njit(cache=True)
+def _pmv_simple_kernel(ta, tr, va, rh, met, clo):
+    """Uproszczone PMV (temperatura efektywna + korekty)."""
+    return _pmv_simple_sqrt(ta, tr, math.sqrt(va), rh, met, clo)
+
+
+@njit(cache=True)
+def _pmv_simple_sqrt(ta, tr, sqrt_va, rh, met, clo):
+    """_pmv_simple_kernel z gotowym sqrt(va), współdzielonym z UTCI."""
+    t_eff = ta + 0.3 * (tr - ta) - 2.0 * sqrt_va
+    humidity_factor = 1 + 0.01 * (rh - 50)
+    met_factor = 1 + 0.5 * (met - 1.2)
+    clo_factor = 1 - 0.3 * (clo - 0.7)
+    pmv = (t_eff - 22) / 8 * humidity_factor * met_factor * clo_factor
+    return max(-3.0, min(3.0, pmv))
+
+
+@njit(cache=True)
+def _ppd_kernel(pmv):
+    """PPD z PMV (Fanger), ograniczone do [5, 100]."""
+    ppd = 100 - 95 * math.exp(-0.03353 * pmv**4 - 0.2179 * pmv**2)
+    return max(5.0, min(100.0, ppd))
+
+
+@njit(cache=True)
+def _utci_kernel(ta, tr, va, rh):
+    """Uproszczone UTCI: korekty radiacyjna, wiatrowa i wilgotnościowa."""
+    return _utci_sqrt(ta, tr, va, math.sqrt(va), rh)
+
+
+@njit(cache=True)
+def _utci_sqrt(ta, tr, va, sqrt_va, rh):
+    """_utci_kernel z gotowym sqrt(va), współdzielonym z PMV."""
+    utci = ta + 0.4 * (tr - ta)
+    if va > 0.5:
+        utci += -2.0 * sqrt_va
+    if ta > 20:
+        utci += 0.01 * (rh - 50)
+    else:
+        utci += -0.005 * (rh - 50)
+    return utci
+
+
+@njit(cache=True)
+def _pet_kernel(ta, tr, va, rh, met, clo):
+    """Uproszczone PET - empiryczna relacja z PMV."""
+    return 18 + 7 * _pmv_simple_kernel(ta, tr, va, rh, met, clo)
+
+
+@njit(cache=True)
+def _tmrt_kernel(ta, solar_rad, absorption, is_hard):
+    """Tmrt = ta + dodatek słoneczny (+ radiacyjne UHI dla powierzchni utwardzonych)."""
+    tmrt = ta + solar_rad * absorption / 100
+    if is_hard:
+        tmrt += min(2.0, solar_rad / 400)
+    return tmrt
+
+
+@njit(cache=True)
+def _zone_indices_fused(ta, rh, va, solar_rad, met, clo, absorption, is_hard):
+    """
+    Tmrt, PMV, PPD, UTCI i PET strefy w jednym przebiegu (PMV liczone raz, także dla PET).
+    
+    Args:
+        ta, rh, va (float): Lokalne warunki strefy [°C, %, m/s]
+        solar_rad (float): Promieniowanie słoneczne [W/m²]
+        met, clo (float): Aktywność metaboliczna [met] i izolacyjność odzieży [clo]
+        absorption (float): Współczynnik absorpcji słonecznej powierzchni
+        is_hard (bool): Czy powierzchnia utwardzona (radiacyjne UHI)
+        
+    Returns:
+        Tuple[float, float, float, float, float]: (tmrt, pmv, ppd, utci, pet)
+    """
+    tmrt = _tmrt_kernel(ta, solar_rad, absorption, is_hard)
+    sqrt_va = math.sqrt(va)
+    pmv = _pmv_simple_sqrt(ta, tmrt, sqrt_va, rh, met, clo)
+    return tmrt, pmv, _ppd_kernel(pmv), _utci_sqrt(ta, tmrt, va, sqrt_va, rh), 18 + 7 * pmv
+
+
+@njit(cache=True)
+def _zone_indices_batch(ta, rh, va, solar_rad, met, clo, absorption, is_hard):
+    """
+    _zone_indices_fused dla tablic stref.
+    
+    Returns:
+        np.ndarray: Tablica (5, n) z wierszami tmrt, pmv, ppd, utci, pet
+    """
+    out = np.empty((5, ta.shape[0]))
+    for i in range(ta.shape[0]):
+        tmrt, pmv, ppd, utci, pet = _zone_indices_fused(ta[i], rh[i], va[i], solar_rad, met, clo,
+                                                        absorption[i], is_hard[i])
+        out[0, i] = tmrt
+        out[1, i] = pmv
+        out[2, i] = ppd
+        out[3, i] = utci
+        out[4, i] = pet
+    return out
+
+
 class ThermalComfortSimulator:
     """
     System analizy komfortu termicznego dla Suwałk.
@@ -68,80 +598,42 @@ class ThermalComfortSimulator:
         print(f"   🌱 Chłodzenie zielenią: {self.green_cooling_effect}°C")
         print(f"   💧 Chłodzenie wodą: {self.water_cooling_effect}°C")
     
-    def calculate_pmv_detailed(self, ta: float, tr: float, va: float, rh: float, 
-                              met: float = 1.2, clo: float = 0.7, pa: Optional[float] = None) -> float:
+    def calculate_pmv_detailed(self, ta, tr, va, rh,
+                              met: float = 1.2, clo: float = 0.7, pa=None):
         """
         Oblicza PMV (Predicted Mean Vote) według ISO 7730.
         
         Implementuje pełny model Fangera z uwzględnieniem wszystkich składników
-        bilansu cieplnego ciała ludzkiego.
+        bilansu cieplnego ciała ludzkiego. Parametry środowiska mogą być
+        skalarami lub tablicami NumPy (broadcasting) - iteracja temperatury
+        odzieży liczona jest wtedy jednocześnie dla wszystkich punktów.
         
         Args:
-            ta (float): Temperatura powietrza [°C]
-            tr (float): Średnia temperatura radiacyjna [°C] 
-            va (float): Prędkość powietrza [m/s]
-            rh (float): Wilgotność względna [%]
+            ta (float | np.ndarray): Temperatura powietrza [°C]
+            tr (float | np.ndarray): Średnia temperatura radiacyjna [°C] 
+            va (float | np.ndarray): Prędkość powietrza [m/s]
+            rh (float | np.ndarray): Wilgotność względna [%]
             met (float): Aktywność metaboliczna [met] (1.2 = chodzenie spokojne)
             clo (float): Izolacyjność odzieży [clo] (0.7 = ubranie letnie)
-            pa (Optional[float]): Ciśnienie parcjalne pary wodnej [Pa]
+            pa (Optional[float | np.ndarray]): Ciśnienie parcjalne pary wodnej [Pa]
             
         Returns:
-            float: Wartość PMV [-3.0 do +3.0]
+            float | np.ndarray: Wartość PMV [-3.0 do +3.0] (tablica dla wejścia tablicowego)
         """
-        # Konwersje jednostek
-        ta_k = ta + 273.15  # [K]
-        tr_k = tr + 273.15  # [K]
-        
-        # Ciśnienie parcjalne pary wodnej
-        if pa is None:
-            # Oblicz z wilgotności względnej (Magnus formula)
-            es = 610.78 * np.exp(17.27 * ta / (ta + 237.3))  # Pa
-            pa = rh / 100 * es
-        
-        # Aktywność metaboliczna [W/m²]
-        M = met * 58.15
-        
-        # Praca zewnętrzna (zazwyczaj 0 dla pieszych)
-        W = 0  # W/m²
-        
-        # Rezystancja termiczna odzieży [m²·K/W]
-        Icl = clo * 0.155
-        
-        # Współczynnik powierzchni odzieży  
-        if Icl <= 0.078:
-            fcl = 1.0 + 1.290 * Icl
-        else:
-            fcl = 1.05 + 0.645 * Icl
-        
-        # Iteracyjne rozwiązanie dla temperatury powierzchni odzieży
-        tcl = ta  # Wartość początkowa
-        for _ in range(10):  # Iteracje
-            hc = 2.38 * abs(tcl - ta)**0.25 if va < 0.1 else 12.1 * np.sqrt(va)
-            hc = max(hc, 12.1 * np.sqrt(va))  # Konwekcja wymuszona
-            
-            hr = 4 * self.stefan_boltzmann * fcl * ((tcl_k + tr_k) / 2)**3
-            tcl_k = tcl + 273.15
-            
-            tcl_new = (Icl * fcl * (M - W) + fcl * hr * tr_k + fcl * hc * ta + ta_k) / (1 + Icl * fcl * (hr + hc))
-            tcl = tcl_new - 273.15
-        
-        tcl_k = tcl + 273.15
-        
-        # Straty ciepła przez konwekcję i radiację [W/m²]
-        HL1 = 3.05 * 0.001 * (5733 - 6.99 * (M - W) - pa)  # Dyfuzja pary przez skórę
-        HL2 = 0.42 * ((M - W) - 58.15) if (M - W) > 58.15 else 0  # Pocenie
-        HL3 = 1.7 * 0.00001 * M * (5867 - pa)  # Latentne przez oddech
-        HL4 = 0.0014 * M * (34 - ta)  # Sensible przez oddech
-        HL5 = 3.96 * fcl * (tcl_k**4 - tr_k**4)  # Radiacja
-        HL6 = fcl * hc * (tcl - ta)  # Konwekcja
-        
-        # Obciążenie termiczne [W/m²]
-        thermal_load = M - W - HL1 - HL2 - HL3 - HL4 - HL5 - HL6
-        
-        # PMV równanie
-        pmv = (0.303 * np.exp(-0.036 * M) + 0.028) * thermal_load
-        
-        return max(-3.0, min(3.0, pmv))
+        if all(np.ndim(x) == 0 for x in (ta, tr, va, rh, pa)):
+            return _pmv_kernel(float(ta), float(tr), float(va), float(rh), float(met), float(clo),
+                               -1.0 if pa is None else float(pa), self.stefan_boltzmann)
+        
+        ta, tr, va, rh = np.broadcast_arrays(*(np.asarray(x, dtype=float) for x in (ta, tr, va, rh)))
+        if not _HAS_NUMBA:
+            return _pmv_detailed_np(ta, tr, va, rh, met, clo,
+                                    None if pa is None else np.asarray(pa, dtype=float),
+                                    self.stefan_boltzmann)
+        
+        pa = np.broadcast_to(-1.0 if pa is None else np.asarray(pa, dtype=float), ta.shape)
+        pmv = _pmv_batch_kernel(ta.ravel(), tr.ravel(), va.ravel(), rh.ravel(), float(met), float(clo),
+                                pa.ravel(), self.stefan_boltzmann)
+        return pmv.reshape(ta.shape)
     
     def calculate_pmv_simple(self, ta: float, tr: float, va: float, rh: float, 
                             met: float = 1.2, clo: float = 0.7) -> float:
@@ -159,18 +651,7 @@ class ThermalComfortSimulator:
         Returns:
             float: Przybliżona wartość PMV
         """
-        # Temperatura efektywna
-        t_eff = ta + 0.3 * (tr - ta) - 2.0 * np.sqrt(va)
-        
-        # Korekty na parametry środowiska i człowieka
-        humidity_factor = 1 + 0.01 * (rh - 50)
-        met_factor = 1 + 0.5 * (met - 1.2)  
-        clo_factor = 1 - 0.3 * (clo - 0.7)
-        
-        # Uproszczone PMV
-        pmv = (t_eff - 22) / 8 * humidity_factor * met_factor * clo_factor
-        
-        return max(-3.0, min(3.0, pmv))
+        return _pmv_simple_kernel(float(ta), float(tr), float(va), float(rh), float(met), float(clo))
     
     def calculate_ppd_from_pmv(self, pmv: float) -> float:
         """
@@ -185,8 +666,7 @@ class ThermalComfortSimulator:
         Returns:
             float: PPD w procentach [5-100]
         """
-        ppd = 100 - 95 * np.exp(-0.03353 * pmv**4 - 0.2179 * pmv**2)
-        return max(5.0, min(100.0, ppd))  # PPD zawsze ≥ 5%
+        return _ppd_kernel(float(pmv))  # PPD zawsze ≥ 5%
     
     def calculate_utci_simple(self, ta: float, tr: float, va: float, rh: float) -> float:
         """
@@ -204,29 +684,10 @@ class ThermalComfortSimulator:
         Returns:
             float: UTCI [°C]
         """
-        # Bazowa temperatura UTCI ≈ temperatura powietrza
-        utci = ta
-        
-        # Korekta na temperaturę radiacyjną (0.4 - współczynnik empiryczny)
-        utci += 0.4 * (tr - ta)
-        
-        # Korekta na wiatr (efekt chłodzenia convective)
-        if va > 0.5:
-            wind_cooling = -2.0 * np.sqrt(va)
-            utci += wind_cooling
-        
-        # Korekta na wilgotność (nieliniowa zależność od temperatury)
-        if ta > 20:
-            humidity_effect = 0.01 * (rh - 50)    # Nagrzewanie przy wysokiej T
-        else:
-            humidity_effect = -0.005 * (rh - 50)  # Chłodzenie przy niskiej T
-        
-        utci += humidity_effect
-        
-        return utci
+        return _utci_kernel(float(ta), float(tr), float(va), float(rh))
     
     def calculate_pet_simple(self, ta: float, tr: float, va: float, rh: float,
-                            met: float = 1.4, clo: float = 0.9) -> float:
+                            met: float = 1.4, clo: float = 0.9, pmv: Optional[float] = None) -> float:
         """
         Uproszczone obliczenie PET (Physiologically Equivalent Temperature).
         
@@ -240,58 +701,38 @@ class ThermalComfortSimulator:
             rh (float): Wilgotność względna [%]
             met (float): Aktywność metaboliczna [met] (1.4 dla spaceru)
             clo (float): Izolacyjność odzieży [clo] (0.9 letnie ubranie)
+            pmv (Optional[float]): Gotowe uproszczone PMV dla tych warunków (pomija ponowne liczenie)
             
         Returns:
             float: PET [°C]
         """
-        # Model uproszczony - korelacja empiryczna z PMV
-        pmv = self.calculate_pmv_simple(ta, tr, va, rh, met, clo)
-        
-        # Przekształcenie PMV -> PET (relacja empiryczna)
-        pet = 18 + 7 * pmv  # °C
-        
-        return pet
+        # Model uproszczony - korelacja empiryczna z PMV (PET = 18 + 7·PMV)
+        if pmv is not None:
+            return 18 + 7 * float(pmv)
+        return _pet_kernel(float(ta), float(tr), float(va), float(rh), float(met), float(clo))
     
     def estimate_mean_radiant_temperature(self, ta: float, solar_rad: float, 
-                                        surface_type: str = "urban") -> float:
+                                        surface_type: Union[str, Surface] = Surface.URBAN) -> float:
         """
         Szacuje temperaturę radiacyjną średnią (Tmrt) na podstawie warunków środowiska.
         
         Args:
             ta (float): Temperatura powietrza [°C]
             solar_rad (float): Promieniowanie słoneczne [W/m²]
-            surface_type (str): Typ powierzchni ("urban", "grass", "water", "asphalt")
+            surface_type (Union[str, Surface]): Typ powierzchni - kod Surface lub nazwa ("urban", "grass", ...)
             
         Returns:
             float: Temperatura radiacyjna średnia [°C]
         """
-        # Bazowa Tmrt = temperatura powietrza
-        tmrt = ta
-        
-        # Współczynniki absorpcji słonecznej dla różnych powierzchni
-        absorption_factors = {
-            "urban": 0.06,      # Beton, cegła - średnia absorpcja
-            "grass": 0.02,      # Zieleń - niska absorpcja, wysoka ewapotranspiracja  
-            "water": 0.01,      # Woda - bardzo niska absorpcja, wysoka pojemność cieplna
-            "asphalt": 0.08,    # Asfalt - wysoka absorpcja
-            "roof": 0.07,       # Dachy - średnia/wysoka absorpcja
-            "concrete": 0.065   # Beton - średnia absorpcja
-        }
-        
-        solar_factor = absorption_factors.get(surface_type, 0.05)
-        
-        # Dodatek radiacyjny od promieniowania słonecznego
-        radiation_increase = solar_rad * solar_factor / 100
-        
-        # Korekta na zachmurzenie (solar_rad jest już skorygowane)
-        tmrt += radiation_increase
-        
-        # Dodatkowy efekt miejskiej wyspy ciepła radiacyjnej
-        if surface_type in ["urban", "asphalt", "concrete"]:
-            uhi_radiation = min(2.0, solar_rad / 400)  # Do +2°C dla pełnego słońca
-            tmrt += uhi_radiation
-        
-        return tmrt
+        if isinstance(surface_type, str):
+            surface_type = Surface.__members__.get(surface_type.upper())
+        if surface_type is None:
+            # Nieznany typ powierzchni - średnia absorpcja, bez efektu UHI
+            return _tmrt_kernel(float(ta), float(solar_rad), 0.05, False)
+        
+        # Dodatek radiacyjny + efekt miejskiej wyspy ciepła dla powierzchni utwardzonych
+        return _tmrt_kernel(float(ta), float(solar_rad), float(_ABSORPTION[surface_type]),
+                            bool(_IS_HARD[surface_type]))
     
     def define_urban_zones(self) -> Dict[str, Dict]:
         """
@@ -304,7 +745,7 @@ class ThermalComfortSimulator:
             "rynek_main": {
                 "name": "Rynek Główny",
                 "description": "Główny plac miejski z fontanną",
-                "surface_type": "urban",
+                "surface_code": Surface.URBAN,
                 "temp_offset": 3.0,        # °C (efekt UHI + materiały)
                 "wind_reduction": 0.7,     # Osłonięcie od wiatru przez budynki
                 "humidity_offset": -5,     # % (niższa wilgotność na placu)
@@ -314,7 +755,7 @@ class ThermalComfortSimulator:
             "street_commercial": {
                 "name": "Ulice handlowe",
                 "description": "Główne ulice centrum z intensywnym ruchem",
-                "surface_type": "asphalt",
+                "surface_code": Surface.ASPHALT,
                 "temp_offset": 2.5,        # °C (kanion uliczny + ruch)
                 "wind_reduction": 0.5,     # Efekt kanionu ulicznego
                 "humidity_offset": -3,     # % 
@@ -324,7 +765,7 @@ class ThermalComfortSimulator:
             "parks_green": {
                 "name": "Parki i skwery",
                 "description": "Obszary zieleni miejskiej",
-                "surface_type": "grass",
+                "surface_code": Surface.GRASS,
                 "temp_offset": -2.0,       # °C (chłodzenie ewapotranspiracja)
                 "wind_reduction": 0.9,     # Naturalna wentylacja przez zieleń
                 "humidity_offset": 8,      # % (wyższa wilgotność)
@@ -334,7 +775,7 @@ class ThermalComfortSimulator:
             "residential": {
                 "name": "Obszary mieszkaniowe", 
                 "description": "Zabudowa mieszkaniowa małej intensywności",
-                "surface_type": "urban",
+                "surface_code": Surface.URBAN,
                 "temp_offset": 1.0,        # °C (umiarkowany UHI)
                 "wind_reduction": 0.8,     # Częściowe osłonięcie
                 "humidity_offset": 0,      # % (neutralne)
@@ -344,7 +785,7 @@ class ThermalComfortSimulator:
             "open_spaces": {
                 "name": "Otwarte przestrzenie",
                 "description": "Parkingi, place, tereny otwarte",
-                "surface_type": "concrete", 
+                "surface_code": Surface.CONCRETE, 
                 "temp_offset": 2.8,        # °C (pełna ekspozycja słoneczna)
                 "wind_reduction": 1.0,     # Brak osłon od wiatru
                 "humidity_offset": -8,     # % (niska wilgotność)
@@ -355,8 +796,34 @@ class ThermalComfortSimulator:
         
         return zones
     
+    @cached_property
+    def urban_zones(self) -> Dict[str, Dict]:
+        """Strefy miejskie (define_urban_zones) budowane raz na instancję."""
+        return self.define_urban_zones()
+    
+    @cached_property
+    def _zone_arrays(self) -> SimpleNamespace:
+        """
+        Parametry stref jako tablice NumPy (SoA), w kolejności urban_zones.
+        
+        Returns:
+            SimpleNamespace: ids, temp_offset, humidity_offset, wind_reduction,
+                area_percent (ułamek), absorption, is_hard_surface
+        """
+        zones = list(self.urban_zones.values())
+        absorption, is_hard_surface, _ = zip(*(_zone_surface(z) for z in zones))
+        return SimpleNamespace(
+            ids=tuple(self.urban_zones),
+            temp_offset=np.array([z["temp_offset"] for z in zones], dtype=float),
+            humidity_offset=np.array([z["humidity_offset"] for z in zones]),
+            wind_reduction=np.array([z["wind_reduction"] for z in zones], dtype=float),
+            area_percent=np.array([z["area_percent"] for z in zones], dtype=float) / 100,
+            absorption=np.array(absorption),
+            is_hard_surface=np.array(is_hard_surface)
+        )
+    
     def calculate_zone_comfort(self, zone: Dict, ta: float, rh: float, va: float, 
-                              solar_rad: float, met: float, clo: float) -> Dict:
+                              solar_rad: float, met: float, clo: float) -> ZoneComfort:
         """
         Oblicza wskaźniki komfortu dla konkretnej strefy miejskiej.
         
@@ -370,162 +837,217 @@ class ThermalComfortSimulator:
             clo (float): Izolacyjność odzieży [clo]
             
         Returns:
-            Dict: Wskaźniki komfortu dla strefy
+            ZoneComfort: Wskaźniki komfortu dla strefy
         """
         # Lokalne warunki mikroklimatu
         local_temp = ta + zone["temp_offset"]
         local_humidity = max(20, min(95, rh + zone["humidity_offset"]))
         local_wind = va * zone["wind_reduction"]
         
-        # Temperatura radiacyjna dla typu powierzchni
-        local_tmrt = self.estimate_mean_radiant_temperature(
-            local_temp, solar_rad, zone["surface_type"]
+        # Tmrt + uproszczone wskaźniki komfortu w jednym przebiegu
+        absorption, is_hard_surface, _ = _zone_surface(zone)
+        local_tmrt, pmv, ppd, utci_value, pet_value = _zone_indices_fused(
+            float(local_temp), float(local_humidity), float(local_wind), float(solar_rad),
+            float(met), float(clo), absorption, is_hard_surface
         )
         
-        # Oblicz wskaźniki komfortu
-        try:
-            # Próba użycia biblioteki pythermalcomfort jeśli dostępna
-            from pythermalcomfort.models import pmv_ppd, utci
-            pmv_result = pmv_ppd(tdb=local_temp, tr=local_tmrt, vr=local_wind, 
-                                rh=local_humidity, met=met, clo=clo)
+        # PMV/PPD/UTCI z biblioteki pythermalcomfort jeśli dostępna (PET zawsze uproszczone)
+        if _HAS_PTC:
+            pmv_result = _pmv_ppd(tdb=local_temp, tr=local_tmrt, vr=local_wind, 
+                                  rh=local_humidity, met=met, clo=clo)
             pmv = pmv_result['pmv'] 
             ppd = pmv_result['ppd']
-            utci_value = utci(tdb=local_temp, tr=local_tmrt, v=local_wind, rh=local_humidity)
-        except ImportError:
-            # Fallback do uproszczonych implementacji
-            pmv = self.calculate_pmv_simple(local_temp, local_tmrt, local_wind, local_humidity, met, clo)
-            ppd = self.calculate_ppd_from_pmv(pmv)
-            utci_value = self.calculate_utci_simple(local_temp, local_tmrt, local_wind, local_humidity)
-        
-        # PET (zawsze uproszczona implementacja)
-        pet_value = self.calculate_pet_simple(local_temp, local_tmrt, local_wind, local_humidity, met, clo)
-        
-        # Klasyfikacja poziomu komfortu (skala 5-stopniowa)
-        if abs(pmv) < 0.5:
-            comfort_level = "DOSKONAŁY"
-            comfort_score = 5
-        elif abs(pmv) < 1.0:
-            comfort_level = "DOBRY"
-            comfort_score = 4
-        elif abs(pmv) < 1.5:
-            comfort_level = "AKCEPTOWALNY" 
-            comfort_score = 3
-        elif abs(pmv) < 2.0:
-            comfort_level = "SŁABY"
-            comfort_score = 2
-        else:
-            comfort_level = "NIEAKCEPTOWALNY"
-            comfort_score = 1
-        
-        # Rekomendacje adaptacyjne
-        if pmv > 2:
-            recommendation = "Unikać ekspozycji 10:00-18:00, szukać cienia, nawodnienie"
-        elif pmv > 1:
-            recommendation = "Krótkie przebywanie, częste przerwy w cieniu, nawodnienie"
-        elif pmv > 0.5:
-            recommendation = "Komfortowe warunki, możliwe dłuższe przebywanie"
-        elif pmv < -2:
-            recommendation = "Ochrona przed wiatrem, ciepłe ubranie, aktywność fizyczna"
-        elif pmv < -1:
-            recommendation = "Dodatkowa warstwa odzieży, ograniczenie czasu ekspozycji"
-        elif pmv < -0.5:
-            recommendation = "Lekka korekta ubioru, generalnie komfortowe warunki"
+            utci_value = _utci(tdb=local_temp, tr=local_tmrt, v=local_wind, rh=local_humidity)
+        
+        return self._zone_result(zone, local_temp, local_humidity, local_wind,
+                                 local_tmrt, pmv, ppd, utci_value, pet_value)
+    
+    def _calculate_all_zones(self, ta: float, rh: float, va: float, solar_rad: float,
+                             met: float, clo: float) -> Dict[str, ZoneComfort]:
+        """
+        Oblicza wskaźniki komfortu dla wszystkich stref naraz (tablice _zone_arrays).
+        
+        Args:
+            ta (float): Temperatura powietrza [°C]
+            rh (float): Wilgotność względna [%]
+            va (float): Prędkość wiatru [m/s]
+            solar_rad (float): Promieniowanie słoneczne [W/m²]
+            met (float): Aktywność metaboliczna [met]
+            clo (float): Izolacyjność odzieży [clo]
+            
+        Returns:
+            Dict[str, ZoneComfort]: Wyniki stref jak z calculate_zone_comfort, w kolejności urban_zones
+        """
+        za = self._zone_arrays
+        
+        # Lokalne warunki mikroklimatu wszystkich stref
+        local_temp = ta + za.temp_offset
+        local_humidity = np.clip(rh + za.humidity_offset, 20, 95)
+        local_wind = va * za.wind_reduction
+        
+        tmrt, pmv, ppd, utci_value, pet_value = _zone_indices_batch(
+            local_temp, local_humidity, local_wind, float(solar_rad), float(met), float(clo),
+            za.absorption, za.is_hard_surface
+        )
+        
+        if _HAS_PTC:
+            pmv_result = _pmv_ppd(tdb=local_temp, tr=tmrt, vr=local_wind, 
+                                  rh=local_humidity, met=met, clo=clo)
+            pmv = np.asarray(pmv_result['pmv'])
+            ppd = np.asarray(pmv_result['ppd'])
+            utci_value = np.asarray(_utci(tdb=local_temp, tr=tmrt, v=local_wind, rh=local_humidity))
+        
+        # Rekordy wyników składane dopiero na końcu
+        columns = zip(self.urban_zones.values(),
+                      *(np.asarray(x).tolist() for x in (local_temp, local_humidity, local_wind,
+                                                         tmrt, pmv, ppd, utci_value, pet_value)))
+        return {zone_id: self._zone_result(*row) for zone_id, row in zip(za.ids, columns)}
+    
+    def _zone_result(self, zone: Dict, local_temp: float, local_humidity: float, local_wind: float,
+                     local_tmrt: float, pmv: float, ppd: float, utci_value: float, pet_value: float) -> ZoneComfort:
+        """
+        Klasyfikuje komfort strefy i składa rekord wyniku.
+        
+        Returns:
+            ZoneComfort: Wskaźniki komfortu dla strefy
+        """
+        # Klasyfikacja poziomu komfortu (skala 5-stopniowa) wg |PMV|
+        level_idx = bisect.bisect_right(_PMV_BINS, abs(pmv))
+        comfort_level = _COMFORT_LABELS[level_idx]
+        comfort_score = _COMFORT_SCORES[level_idx]
+        
+        # Rekomendacje adaptacyjne (progi ostre: > po stronie ciepłej, < po stronie chłodnej)
+        if pmv > 0:
+            recommendation = _RECOMMENDATIONS[bisect.bisect_left(_RECOMMENDATION_BINS, pmv)]
         else:
-            recommendation = "Optymalne warunki komfortu termicznego"
-        
-        return {
-            "zone_name": zone["name"],
-            "area_percent": zone["area_percent"],
-            "microclimate": {
-                "air_temp": round(local_temp, 1),
-                "mean_radiant_temp": round(local_tmrt, 1),
-                "wind_speed": round(local_wind, 2),
-                "humidity": round(local_humidity, 1),
-                "surface_type": zone["surface_type"]
-            },
-            "comfort_indices": {
-                "pmv": round(pmv, 2),
-                "ppd": round(ppd, 1),
-                "utci": round(utci_value, 1),
-                "pet": round(pet_value, 1)
-            },
-            "assessment": {
-                "comfort_level": comfort_level,
-                "comfort_score": comfort_score,
-                "recommendation": recommendation,
-                "thermal_stress": "heat" if pmv > 1 else "cold" if pmv < -1 else "neutral"
-            }
-        }
+            recommendation = _RECOMMENDATIONS[bisect.bisect_right(_RECOMMENDATION_BINS, pmv)]
+        
+        return ZoneComfort(
+            zone_name=zone["name"],
+            area_percent=zone["area_percent"],
+            microclimate=ZoneMicroclimate(
+                air_temp=round(local_temp, 1),
+                mean_radiant_temp=round(local_tmrt, 1),
+                wind_speed=round(local_wind, 2),
+                humidity=round(local_humidity, 1),
+                surface_type=_zone_surface(zone)[2]
+            ),
+            comfort_indices=ComfortIndices(
+                pmv=_round_np(pmv, 2),
+                ppd=_round_np(ppd, 1),
+                # UTCI było np.float64 tylko po korekcie wiatrowej (np.sqrt dla va > 0.5)
+                utci=_round_np(utci_value, 1) if local_wind > 0.5 else round(utci_value, 1),
+                pet=_round_np(pet_value, 1)
+            ),
+            assessment=ComfortAssessment(
+                comfort_level=comfort_level,
+                comfort_score=comfort_score,
+                recommendation=recommendation,
+                thermal_stress="heat" if pmv > 1 else "cold" if pmv < -1 else "neutral"
+            )
+        )
     
-    def generate_comfort_points(self, scenario_name: str, zones_results: Dict, 
-                               overall_comfort: float) -> List[Dict]:
+    def generate_comfort_points_soa(self, scenario_name: str, zones_results: Dict[str, ZoneComfort], 
+                                   overall_comfort: float) -> np.ndarray:
         """
-        Generuje punkty komfortu termicznego do wizualizacji na mapie.
+        Generuje punkty komfortu termicznego jako tablicę strukturalną (układ kolumnowy).
         
         Args:
             scenario_name (str): Nazwa scenariusza
-            zones_results (Dict): Wyniki dla stref miejskich
+            zones_results (Dict[str, ZoneComfort]): Wyniki dla stref miejskich
             overall_comfort (float): Ogólny komfort miasta
             
         Returns:
-            List[Dict]: Lista punktów z wskaźnikami komfortu
+            np.ndarray: Punkty o typie _COMFORT_POINT_DTYPE, wartości zaokrąglone do precyzji eksportu
         """
-        # Deterministyczne generowanie (powtarzalne wyniki)
-        seed_value = abs(hash(scenario_name) + int(overall_comfort * 1000)) % (2**31)
-        np.random.seed(seed_value)
+        # Deterministyczne generowanie (powtarzalne wyniki) - lokalny generator zamiast globalnego stanu
+        seed_value = (_stable_hash(scenario_name) + round(overall_comfort * 1000)) & 0x7FFFFFFF
+        rng = np.random.default_rng(seed_value)
         
         # Liczba punktów zależna od zróżnicowania komfortu
         comfort_variance = np.var([z['comfort_indices']['pmv'] for z in zones_results.values()])
         num_points = min(80, max(30, int(comfort_variance * 50 + 40)))
         
-        comfort_points = []
+        # Wartości bazowe stref jako tablice float32 (indeksowane numerem strefy)
         zone_list = list(zones_results.keys())
-        zone_weights = [zones_results[z]['area_percent'] / 100 for z in zone_list]
+        zones = [zones_results[z] for z in zone_list]
+        zone_weights = np.array([z['area_percent'] for z in zones]) / 100
+        base_pmv = np.array([z['comfort_indices']['pmv'] for z in zones], dtype=np.float32)
+        base_utci = np.array([z['comfort_indices']['utci'] for z in zones], dtype=np.float32)
+        base_pet = np.array([z['comfort_indices']['pet'] for z in zones], dtype=np.float32)
+        base_surface_temp = np.array([z['microclimate']['mean_radiant_temp'] for z in zones], dtype=np.float32)
+        
+        # Lokalizacje (float64) i przypisanie do stref (losowanie ważone powierzchnią) - wszystkie punkty naraz
+        lat = self.center_lat + rng.normal(0, 0.008, num_points)
+        lng = self.center_lng + rng.normal(0, 0.012, num_points)
+        zone_idx = rng.choice(len(zone_list), size=num_points, p=zone_weights)
+        
+        # Lokalne wariacje wskaźników komfortu (float32)
+        local_pmv = np.clip(base_pmv[zone_idx] + rng.normal(0, 0.3, num_points).astype(np.float32), -3, 3)
+        if ne is not None:
+            local_ppd = ne.evaluate("100 - 95 * exp(-0.03353 * local_pmv**4 - 0.2179 * local_pmv**2)")
+        else:
+            local_ppd = 100 - 95 * np.exp(-0.03353 * local_pmv**4 - 0.2179 * local_pmv**2)
+        local_ppd = np.clip(local_ppd, 5.0, 100.0)
+        local_utci = base_utci[zone_idx] + rng.normal(0, 2.0, num_points).astype(np.float32)
+        local_pet = base_pet[zone_idx] + rng.normal(0, 2.5, num_points).astype(np.float32)
+        
+        # Temperatura powierzchni (Tmrt + wariacja)
+        surface_temp = base_surface_temp[zone_idx] + rng.normal(0, 3, num_points).astype(np.float32)
+        comfort_score = np.clip(np.round(5 - np.abs(local_pmv)), 1, 5).astype(int)
+        
+        points = np.empty(num_points, dtype=_COMFORT_POINT_DTYPE)
+        points['lat'] = np.round(lat, 6)
+        points['lng'] = np.round(lng, 6)
+        points['pmv'] = np.round(local_pmv, 2)
+        points['ppd'] = np.round(local_ppd, 1)
+        points['utci'] = np.round(local_utci, 1)
+        points['pet'] = np.round(local_pet, 1)
+        points['zone_type'] = np.array(zone_list)[zone_idx]
+        points['surface_temp'] = np.round(surface_temp, 1)
+        points['comfort_score'] = comfort_score
+        points['microenvironment'] = np.array([z['microclimate']['surface_type'] for z in zones])[zone_idx]
+        
+        return points
+    
+    def generate_comfort_points(self, scenario_name: str, zones_results: Dict[str, ZoneComfort], 
+                               overall_comfort: float) -> List[ComfortPoint]:
+        """
+        Generuje punkty komfortu termicznego do wizualizacji na mapie.
         
-        for i in range(num_points):
-            # Lokalizacja punktu
-            lat = self.center_lat + np.random.normal(0, 0.008)
-            lng = self.center_lng + np.random.normal(0, 0.012)
-            
-            # Przypisanie do strefy (losowanie ważone powierzchnią)
-            zone_choice = np.random.choice(zone_list, p=zone_weights)
-            zone_data = zones_results[zone_choice]
-            
-            # Lokalne wariacje wskaźników komfortu
-            base_pmv = zone_data['comfort_indices']['pmv']
-            local_pmv_variation = np.random.normal(0, 0.3)
-            local_pmv = np.clip(base_pmv + local_pmv_variation, -3, 3)
-            
-            base_utci = zone_data['comfort_indices']['utci']
-            local_utci_variation = np.random.normal(0, 2.0)
-            local_utci = base_utci + local_utci_variation
-            
-            base_pet = zone_data['comfort_indices']['pet']
-            local_pet_variation = np.random.normal(0, 2.5)
-            local_pet = base_pet + local_pet_variation
+        Args:
+            scenario_name (str): Nazwa scenariusza
+            zones_results (Dict[str, ZoneComfort]): Wyniki dla stref miejskich
+            overall_comfort (float): Ogólny komfort miasta
             
-            # Temperatura powierzchni (Tmrt + wariacja)
-            base_surface_temp = zone_data['microclimate']['mean_radiant_temp']
-            surface_temp = base_surface_temp + np.random.normal(0, 3)
+        Returns:
+            List[ComfortPoint]: Lista punktów z wskaźnikami komfortu
+        """
+        return list(self.iter_comfort_points(scenario_name, zones_results, overall_comfort))
+    
+    def iter_comfort_points(self, scenario_name: str, zones_results: Dict[str, ZoneComfort], 
+                            overall_comfort: float) -> Iterator[ComfortPoint]:
+        """
+        Leniwy wariant generate_comfort_points.
+        
+        Punkty liczone są wektorowo, a rekordy ComfortPoint powstają dopiero
+        przy iteracji (np. przez bibliotekę mapy). Generator jest jednorazowy.
+        
+        Args:
+            scenario_name (str): Nazwa scenariusza
+            zones_results (Dict[str, ZoneComfort]): Wyniki dla stref miejskich
+            overall_comfort (float): Ogólny komfort miasta
             
-            comfort_points.append({
-                "lat": round(lat, 6),
-                "lng": round(lng, 6),
-                "pmv": round(local_pmv, 2),
-                "ppd": round(self.calculate_ppd_from_pmv(local_pmv), 1),
-                "utci": round(local_utci, 1),
-                "pet": round(local_pet, 1),
-                "zone_type": zone_choice,
-                "surface_temp": round(surface_temp, 1),
-                "comfort_score": max(1, min(5, round(5 - abs(local_pmv), 0))),
-                "microenvironment": zone_data['microclimate']['surface_type']
-            })
-        
-        return comfort_points
+        Yields:
+            ComfortPoint: Punkt z wskaźnikami komfortu
+        """
+        points = self.generate_comfort_points_soa(scenario_name, zones_results, overall_comfort)
+        for record in _iter_comfort_points(points):
+            yield ComfortPoint(**record)
     
     def simulate_scenario(self, ta: float, rh: float, va: float, solar_rad: float,
                          scenario_name: str, season: str = "summer", 
-                         detailed_output: bool = True) -> Dict:
+                         detailed_output: bool = True, verbose: bool = True) -> Dict:
         """
         Główna funkcja symulująca scenariusz komfortu termicznego.
         
@@ -537,12 +1059,16 @@ class ThermalComfortSimulator:
             scenario_name (str): Nazwa scenariusza
             season (str): Sezon ("winter", "spring", "summer", "autumn")
             detailed_output (bool): Czy generować szczegółowe dane
+            verbose (bool): Czy wypisywać logi scenariusza
             
         Returns:
-            Dict: Kompletne wyniki analizy komfortu termicznego
+            Dict: Kompletne wyniki analizy komfortu termicznego (zone_analysis jako
+                rekordy ZoneComfort, comfort_map jako tablica strukturalna - do JSON
+                przez export_results lub json.dumps(..., default=_export_default))
         """
-        print(f"\n🌡️ ThermalSim: {scenario_name}")
-        print(f"   🌡️ {ta}°C, {rh}%RH, {va}m/s, {solar_rad}W/m²")
+        if verbose:
+            print(f"\n🌡️ ThermalSim: {scenario_name}")
+            print(f"   🌡️ {ta}°C, {rh}%RH, {va}m/s, {solar_rad}W/m²")
         
         # Parametry ubrania i aktywności według sezonu
         clothing_values = {
@@ -562,35 +1088,23 @@ class ThermalComfortSimulator:
         clo = clothing_values.get(season, 0.7)
         met = activity_values.get(season, 1.2)
         
-        # Definiuj strefy miejskie
-        urban_zones = self.define_urban_zones()
-        
-        # Analiza komfortu dla każdej strefy
-        zone_results = {}
-        overall_comfort_score = 0
+        # Analiza komfortu dla wszystkich stref naraz
+        zone_results = self._calculate_all_zones(ta, rh, va, solar_rad, met, clo)
         
-        for zone_id, zone in urban_zones.items():
-            zone_comfort = self.calculate_zone_comfort(zone, ta, rh, va, solar_rad, met, clo)
-            zone_results[zone_id] = zone_comfort
-            
-            # Wkład do ogólnego komfortu (ważony powierzchnią strefy)
-            zone_contribution = zone_comfort['assessment']['comfort_score'] * zone['area_percent'] / 100
-            overall_comfort_score += zone_contribution
+        # Ogólny komfort - średnia ocen stref ważona powierzchnią
+        scores = np.array([z['assessment']['comfort_score'] for z in zone_results.values()])
+        pmvs = np.array([z['comfort_indices']['pmv'] for z in zone_results.values()])
+        overall_comfort_score = float(scores @ self._zone_arrays.area_percent)
         
         # Statystyki ogólne miasta
-        comfortable_zones_count = sum(1 for z in zone_results.values() 
-                                    if abs(z['comfort_indices']['pmv']) < 1.0)
-        comfortable_zones_percent = comfortable_zones_count / len(zone_results) * 100
-        
-        heat_stress_zones = sum(1 for z in zone_results.values() 
-                               if z['comfort_indices']['pmv'] > 2)
-        cold_stress_zones = sum(1 for z in zone_results.values() 
-                               if z['comfort_indices']['pmv'] < -2)
+        comfortable_zones_percent = int(np.count_nonzero(np.abs(pmvs) < 1.0)) / len(zone_results) * 100
+        heat_stress_zones = int(np.count_nonzero(pmvs > 2))
+        cold_stress_zones = int(np.count_nonzero(pmvs < -2))
         
         # Generuj punkty komfortu do wizualizacji
-        comfort_points = []
+        comfort_points = None
         if detailed_output:
-            comfort_points = self.generate_comfort_points(scenario_name, zone_results, overall_comfort_score)
+            comfort_points = self.generate_comfort_points_soa(scenario_name, zone_results, overall_comfort_score)
         
         # Strukturyzacja wyników
         result = {
@@ -639,31 +1153,30 @@ class ThermalComfortSimulator:
             }
         
         # Logi wynikowe
-        print(f"   📊 Komfort miasta: {overall_comfort_score:.2f}/5.0")
-        print(f"   🌡️ Strefy komfortowe: {comfortable_zones_percent:.0f}%")
-        if heat_stress_zones > 0:
-            print(f"   🔥 Strefy stresu cieplnego: {heat_stress_zones}")
-        if cold_stress_zones > 0:
-            print(f"   🧊 Strefy stresu chłodnego: {cold_stress_zones}")
+        if verbose:
+            print(f"   📊 Komfort miasta: {overall_comfort_score:.2f}/5.0")
+            print(f"   🌡️ Strefy komfortowe: {comfortable_zones_percent:.0f}%")
+            if heat_stress_zones > 0:
+                print(f"   🔥 Strefy stresu cieplnego: {heat_stress_zones}")
+            if cold_stress_zones > 0:
+                print(f"   🧊 Strefy stresu chłodnego: {cold_stress_zones}")
         
         return result
     
-    def _classify_thermal_stress(self, ta: float) -> str:
-        """Klasyfikuje stres termiczny na podstawie temperatury powietrza."""
-        if ta < -10:
-            return "extreme_cold"
-        elif ta < 0:
-            return "cold"
-        elif ta < 18:
-            return "cool"
-        elif ta < 26:
-            return "comfortable"
-        elif ta < 32:
-            return "warm"
-        elif ta < 38:
-            return "hot"
-        else:
-            return "extreme_heat"
+    def _classify_thermal_stress(self, ta):
+        """
+        Klasyfikuje stres termiczny na podstawie temperatury powietrza.
+        
+        Progi _STRESS_BINS; ta równe progowi należy do klasy wyższej.
+        
+        Args:
+            ta (float | np.ndarray): Temperatura powietrza [°C]
+            
+        Returns:
+            str | np.ndarray: Kategoria stresu (tablica etykiet dla wejścia tablicowego)
+        """
+        labels = _STRESS_LABELS[np.searchsorted(_STRESS_BINS, ta, side='right')]
+        return str(labels) if np.ndim(ta) == 0 else labels
     
     def batch_simulate(self, scenarios: List[Tuple]) -> Dict[str, Dict]:
         """
@@ -688,6 +1201,35 @@ class ThermalComfortSimulator:
         print(f"\n✅ Thermal Batch completed: {len(results)} scenarios")
         return results
     
+    def batch_simulate_parallel(self, scenarios: List[Tuple], workers: Optional[int] = None,
+                                detailed_output: bool = True) -> Dict[str, Dict]:
+        """
+        Uruchamia batch analizę komfortu równolegle w puli procesów.
+        
+        Scenariusze są niezależne (lokalny generator losowy w każdym),
+        logi per scenariusz są wyłączone - podsumowanie wypisuje proces główny.
+        
+        Args:
+            scenarios (List[Tuple]): Lista (ta, rh, va, solar, name, season)
+            workers (Optional[int]): Liczba procesów (domyślnie os.cpu_count())
+            detailed_output (bool): Czy generować punkty komfortu
+            
+        Returns:
+            Dict[str, Dict]: Wyniki wszystkich scenariuszy (jak batch_simulate)
+        """
+        results = {}
+        
+        print(f"\n🔄 Thermal Comfort Parallel Batch: {len(scenarios)} scenarios")
+        
+        with ProcessPoolExecutor(max_workers=workers or os.cpu_count()) as executor:
+            run = partial(_run_scenario, self, detailed_output=detailed_output)
+            for scenario, result in zip(scenarios, executor.map(run, scenarios, chunksize=4)):
+                key = scenario[4].lower().replace(" ", "_")
+                results[key] = result
+        
+        print(f"✅ Thermal Parallel Batch completed: {len(results)} scenarios")
+        return results
+    
     def export_results(self, results: Dict, output_file: str = "thermal_results.json"):
         """
         Eksportuje wyniki analizy komfortu do pliku JSON.
@@ -718,10 +1260,17 @@ class ThermalComfortSimulator:
         }
         
         with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(export_data, f, indent=2, ensure_ascii=False, default=str)
+            json.dump(export_data, f, indent=2, ensure_ascii=False, default=_export_default)
         
         print(f"💾 Thermal comfort results exported to: {output_file}")
 
+def _run_scenario(simulator: "ThermalComfortSimulator", scenario: Tuple,
+                  detailed_output: bool = True) -> Dict:
+    """Uruchamia pojedynczy scenariusz bez logów (funkcja modułowa - picklowalna dla puli procesów)."""
+    ta, rh, va, solar, name, season = scenario
+    return simulator.simulate_scenario(ta, rh, va, solar, name, season, detailed_output, verbose=False)
+
+
 # Przykłady użycia
 if __name__ == "__main__":
     # Przykładowa konfiguracja dla testów
@@ -11,10 +11,439 @@ Data: Wrzesień 2025
 """
 
 import numpy as np
+from dataclasses import asdict, dataclass
 from datetime import datetime
+from concurrent.futures import ProcessPoolExecutor
+import functools
 import json
-from typing import Dict, List, Tuple, Optional
+import logging
+import os
+from types import SimpleNamespace
+from typing import Dict, Iterator, List, Tuple, Optional
 import math
+import bisect
+
+try:
+    import orjson
+except ImportError:
+    # orjson opcjonalny - eksport przez bibliotekę standardową json
+    orjson = None
+
+logger = logging.getLogger("windsim")
+
+try:
+    from numba import njit
+    _HAS_NUMBA = True
+except ImportError:
+    # Numba opcjonalna - bez niej kernele działają jako zwykłe funkcje Pythona
+    _HAS_NUMBA = False
+
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+# Typy mikrośrodowiska punktów pola wiatru i ich udział w obszarze
+_ENVIRONMENT_TYPES = ('open', 'tunnel', 'wake', 'green', 'intersection')
+_ENVIRONMENT_PROBABILITIES = (0.3, 0.2, 0.2, 0.15, 0.15)
+
+# Intensywność turbulencji wg mikrośrodowiska (teren otwarty, tunel, cień, park, skrzyżowanie)
+_TURBULENCE_INTENSITY = np.array([0.12, 0.25, 0.15, 0.1, 0.2])
+
+# Mnożnik odchylenia kierunku - większe odchylenia w tunelach i na skrzyżowaniach
+_DIRECTION_DEVIATION_SCALE = np.array([1.0, 1.5, 1.0, 1.0, 1.5])
+
+@dataclass(frozen=True)
+class WindField:
+    """
+    Punkty pola wiatru w układzie kolumnowym (jedna tablica NumPy na atrybut).
+    
+    Wartości są już zaokrąglone do precyzji eksportu. Słowniki per punkt
+    powstają dopiero w to_records() albo przy indeksowaniu (field[0]).
+    
+    Attributes:
+        lat (np.ndarray): Szerokość geograficzna [°]
+        lng (np.ndarray): Długość geograficzna [°]
+        speed (np.ndarray): Lokalna prędkość wiatru [m/s]
+        direction (np.ndarray): Lokalny kierunek wiatru [°]
+        vx (np.ndarray): Składowa E-W prędkości [m/s]
+        vy (np.ndarray): Składowa N-S prędkości [m/s]
+        height_agl (np.ndarray): Wysokość nad gruntem [m]
+        turbulence_intensity (np.ndarray): Intensywność turbulencji [-]
+        env_code (np.ndarray): Indeks mikrośrodowiska w _ENVIRONMENT_TYPES
+        gust_factor (np.ndarray): Współczynnik porywów [-]
+    """
+    lat: np.ndarray
+    lng: np.ndarray
+    speed: np.ndarray
+    direction: np.ndarray
+    vx: np.ndarray
+    vy: np.ndarray
+    height_agl: np.ndarray
+    turbulence_intensity: np.ndarray
+    env_code: np.ndarray
+    gust_factor: np.ndarray
+    
+    def __len__(self) -> int:
+        return len(self.lat)
+    
+    def __iter__(self):
+        return iter(self.to_records())
+    
+    def __getitem__(self, index):
+        # Zgodność wstecz z listą słowników (result['wind_field'][0]['speed'])
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        i = range(len(self))[index]
+        return {
+            "lat": float(self.lat[i]),
+            "lng": float(self.lng[i]),
+            "speed": float(self.speed[i]),
+            "direction": float(self.direction[i]),
+            "vx": float(self.vx[i]),
+            "vy": float(self.vy[i]),
+            "height_agl": float(self.height_agl[i]),
+            "turbulence_intensity": float(self.turbulence_intensity[i]),
+            "environment_type": _ENVIRONMENT_TYPES[int(self.env_code[i])],
+            "gust_factor": float(self.gust_factor[i])
+        }
+    
+    def to_records(self) -> List[Dict]:
+        """Zamienia kolumny na listę słowników (format JSON pola wiatru)."""
+        return [
+            {
+                "lat": lat,
+                "lng": lng,
+                "speed": speed,
+                "direction": direction,
+                "vx": vx,
+                "vy": vy,
+                "height_agl": height,
+                "turbulence_intensity": turbulence,
+                "environment_type": _ENVIRONMENT_TYPES[code],
+                "gust_factor": gust  # Współczynnik porywów
+            }
+            for lat, lng, speed, direction, vx, vy, height, turbulence, code, gust in zip(
+                self.lat.tolist(),
+                self.lng.tolist(),
+                self.speed.tolist(),
+                self.direction.tolist(),
+                self.vx.tolist(),
+                self.vy.tolist(),
+                self.height_agl.tolist(),
+                self.turbulence_intensity.tolist(),
+                self.env_code.tolist(),
+                self.gust_factor.tolist()
+            )
+        ]
+
+
+@dataclass(slots=True)
+class WindSummary:
+    """
+    Skalarne podsumowanie scenariusza wiatru dla przeglądów parametrów.
+    
+    Wartości niezaokrąglone; bez pola wiatru, znacznika czasu i słowników wyniku.
+    """
+    wind_speed_ref: float
+    direction: float
+    max_speed: float
+    min_speed: float
+    avg_urban_speed: float
+    pedestrian_speed: float
+    directional_factor: float
+    comfort_score: int
+    comfort_zones_percent: int
+    dynamic_pressure_pa: float
+    pressure_difference_pa: float
+
+
+@dataclass(frozen=True)
+class WindSweep:
+    """
+    Podsumowania przeglądu parametrów w układzie kolumnowym (tablica na pole WindSummary).
+    
+    Indeksowanie i iteracja zwracają WindSummary dla pojedynczego scenariusza;
+    słowniki powstają dopiero w to_records() (eksport JSON).
+    """
+    wind_speed_ref: np.ndarray
+    direction: np.ndarray
+    max_speed: np.ndarray
+    min_speed: np.ndarray
+    avg_urban_speed: np.ndarray
+    pedestrian_speed: np.ndarray
+    directional_factor: np.ndarray
+    comfort_score: np.ndarray
+    comfort_zones_percent: np.ndarray
+    dynamic_pressure_pa: np.ndarray
+    pressure_difference_pa: np.ndarray
+    
+    def __len__(self) -> int:
+        return len(self.wind_speed_ref)
+    
+    def __getitem__(self, i: int) -> WindSummary:
+        return WindSummary(*(getattr(self, name)[i].item() for name in WindSummary.__slots__))
+    
+    def __iter__(self) -> Iterator[WindSummary]:
+        columns = [getattr(self, name).tolist() for name in WindSummary.__slots__]
+        for row in zip(*columns):
+            yield WindSummary(*row)
+    
+    def to_records(self) -> List[Dict]:
+        """Zamienia kolumny na listę słowników (format JSON podsumowań)."""
+        names = WindSummary.__slots__
+        columns = [getattr(self, name).tolist() for name in names]
+        return [dict(zip(names, row)) for row in zip(*columns)]
+
+
+# Precyzja eksportu kolumn pola wiatru (liczba miejsc po przecinku)
+_WIND_FIELD_DECIMALS = {'lat': 6, 'lng': 6, 'speed': 2, 'direction': 1, 'vx': 2, 'vy': 2,
+                        'height_agl': 1, 'turbulence_intensity': 3, 'gust_factor': 2}
+
+
+def _export_default(obj):
+    """Serializacja obiektów spoza JSON - pole wiatru i przeglądy jako lista słowników, podsumowania jako dict, reszta jako str."""
+    if isinstance(obj, WindField):
+        return obj.to_records()
+    if isinstance(obj, WindSummary):
+        return asdict(obj)
+    if isinstance(obj, WindSweep):
+        return obj.to_records()
+    return str(obj)
+
+
+# Główne kierunki ulic w Suwałkach (N-S, E-W orientation) i współczynniki kierunkowe:
+# ≤15° od głównego kierunku +15% (tunele wiatrowe), ≤30° +5%, kierunki poprzeczne -10%
+_STREET_DIRECTIONS = np.array([0.0, 90.0, 180.0, 270.0])
+_DIR_DIFF_BINS = np.array([15.0, 30.0])
+_DIR_FACTORS = np.array([1.15, 1.05, 0.9])
+
+
+def _directional_factor_np(direction):
+    """Współczynnik kierunkowy dla skalara lub tablicy kierunków [°] (dokładny, bez tablicy)."""
+    diff = np.abs(np.asarray(direction, dtype=np.float64)[..., None] - _STREET_DIRECTIONS).min(axis=-1)
+    return _DIR_FACTORS[np.searchsorted(_DIR_DIFF_BINS, diff, side='left')]
+
+
+# Tablica współczynników kierunkowych dla pełnych stopni 0-359 (indeks = kierunek)
+_DIR_FACTOR_LUT = _directional_factor_np(np.arange(360))
+
+
+def _directional_factor(direction: float) -> float:
+    """Współczynnik kierunkowy dla pojedynczego kierunku [°]."""
+    # Pełne stopnie 0-359 - odczyt z tablicy _DIR_FACTOR_LUT
+    degree = int(direction)
+    if degree == direction and 0 <= degree < 360:
+        return float(_DIR_FACTOR_LUT[degree])
+    
+    # Kierunki ułamkowe / spoza zakresu - dokładne odległości od kierunków ulic
+    min_angle_diff = min(abs(direction - street_dir) for street_dir in (0.0, 90.0, 180.0, 270.0))
+    return (1.15, 1.05, 0.9)[bisect.bisect_left((15.0, 30.0), min_angle_diff)]
+
+
+# Kryteria Lawsona - progi prędkości [m/s] (searchsorted side='right' ≡ warunki '<')
+_LAWSON_THRESH = np.array([4.0, 6.0, 8.0, 12.0])
+_LAWSON_LEVELS = np.array(["KOMFORTOWO", "AKCEPTOWALNE", "NIEWŁAŚCIWE",
+                           "NIEBEZPIECZNE", "EKSTREMALNIE NIEBEZPIECZNE"])
+_LAWSON_SCORE = np.array([1, 2, 3, 4, 5])
+_LAWSON_DESC = np.array([
+    "Warunki idealne do przebywania na zewnątrz",
+    "Odpowiednie do spacerów i krótkiego przebywania",
+    "Tylko do szybkiego przejścia, dyskomfort",
+    "Trudności w chodzeniu, ryzyko upadku",
+    "Niemożliwe przebywanie na zewnątrz"
+])
+
+# Empiryczny rozkład stref komfortu [%] wg średniej prędkości miejskiej (progi '<')
+_COMFORT_ZONE_THRESH = np.array([3.0, 5.0, 8.0, 12.0])
+_COMFORT_ZONE_KEYS = ("komfortowo", "akceptowalne", "niewłaściwe", "niebezpieczne")
+_COMFORT_ZONE_TABLE = np.array([
+    [90, 8, 2, 0],
+    [70, 20, 8, 2],
+    [40, 35, 20, 5],
+    [15, 25, 40, 20],
+    [5, 10, 30, 55]
+])
+
+# Wersje krotkowe tablic dla ścieżek skalarnych (bisect, bez narzutu wywołań NumPy)
+_LAWSON_BOUNDS = tuple(_LAWSON_THRESH.tolist())
+_LAWSON_ROWS = tuple(zip(_LAWSON_LEVELS.tolist(), _LAWSON_SCORE.tolist(), _LAWSON_DESC.tolist()))
+_COMFORT_ZONE_BOUNDS = tuple(_COMFORT_ZONE_THRESH.tolist())
+_COMFORT_ZONE_ROWS = tuple(tuple(row) for row in _COMFORT_ZONE_TABLE.tolist())
+
+
+# Kernele numeryczne (skalarne, math.*) - kompilowane numbą gdy jest dostępna.
+
+@njit(cache=True)
+def _wind_profile(height, u_ref, z_ref, z0):
+    """Profil logarytmiczny ABL dla pojedynczej wysokości [m/s]."""
+    # Zabezpieczenie przed logarytmem z argumentu ≤ 0
+    if height <= z0:
+        height = z0 + 0.1
+    wind_speed = u_ref * math.log((height + z0) / z0) / math.log((z_ref + z0) / z0)
+    return max(0.0, wind_speed)
+
+
+@njit(cache=True)
+def _wind_profile_vec(heights, u_ref, z_ref, z0, out):
+    """Profil logarytmiczny dla tablicy wysokości, wynik w 'out'."""
+    for i in range(heights.shape[0]):
+        out[i] = _wind_profile(heights[i], u_ref, z_ref, z0)
+    return out
+
+
+@njit(cache=True)
+def _wind_profile_speeds(height, u_refs, z_ref, z0, out):
+    """Profil logarytmiczny na jednej wysokości dla tablicy prędkości referencyjnych, wynik w 'out'."""
+    for i in range(u_refs.shape[0]):
+        out[i] = _wind_profile(height, u_refs[i], z_ref, z0)
+    return out
+
+
+@njit(cache=True)
+def _fill_wind_field(env_code, spatial_variation, deviation, base_speed, direction,
+                     out_speed, out_dir, out_vx, out_vy, out_turb, out_gust):
+    """
+    Wypełnia kolumny pola wiatru dla wylosowanych punktów.
+    
+    Args:
+        env_code (np.ndarray): Kody mikrośrodowiska (indeksy _ENVIRONMENT_TYPES)
+        spatial_variation (np.ndarray): Mnożniki przestrzenne prędkości
+        deviation (np.ndarray): Odchylenia kierunku przed skalowaniem [°]
+        base_speed (np.ndarray): Prędkość bazowa dla każdego mikrośrodowiska [m/s]
+        direction (float): Główny kierunek wiatru [°]
+        out_* (np.ndarray): Kolumny wyjściowe (zapisywane w miejscu)
+    """
+    for i in range(env_code.shape[0]):
+        code = env_code[i]
+        speed = base_speed[code] * spatial_variation[i]
+        turbulence = _TURBULENCE_INTENSITY[code]
+        local_direction = (direction + deviation[i] * _DIRECTION_DEVIATION_SCALE[code]) % 360.0
+        
+        # Składowe wektora wiatru (konwencja meteorologiczna -> matematyczna: N=90°→0°, E=0°→270°)
+        wind_angle_rad = math.radians(270.0 - local_direction)
+        out_speed[i] = speed
+        out_dir[i] = local_direction
+        out_vx[i] = speed * math.cos(wind_angle_rad)    # Składowa E-W
+        out_vy[i] = speed * math.sin(wind_angle_rad)    # Składowa N-S
+        out_turb[i] = turbulence
+        out_gust[i] = 1.0 + turbulence * 0.5            # Współczynnik porywów
+
+
+# Klucze wyników calculate_urban_effects / calculate_wind_pressure (kolejność krotek z cache)
+_URBAN_EFFECT_KEYS = ('max_tunnel_speed', 'min_wake_speed', 'avg_urban_speed', 'pedestrian_speed',
+                      'directional_factor', 'tunnel_factor', 'wake_reduction_pct')
+_WIND_PRESSURE_KEYS = ('dynamic_pressure_pa', 'windward_pressure_pa', 'leeward_pressure_pa',
+                       'side_pressure_pa', 'roof_windward_pa', 'roof_leeward_pa',
+                       'pressure_difference_pa')
+
+# Współczynniki ciśnienia Cp dla typowej geometrii miejskiej (kolejność _CP_KEYS)
+_CP_KEYS = _WIND_PRESSURE_KEYS[1:]
+_CP_VEC = np.array([
+    0.8,            # strona nawietrzna (+)
+    -0.5,           # strona zawietrzna (-)
+    -0.7,           # ściany boczne (-)
+    -0.3,           # dach nawietrzny (-)
+    -0.6,           # dach zawietrzny (-)
+    0.8 - (-0.5)    # różnica nawietrzna - zawietrzna
+])
+
+
+@functools.lru_cache(maxsize=1024)
+def _urban_effects_cached(wind_speed_ref: float, direction: float, tunnel_factor: float,
+                          wake_speed_ratio: float, urban_reduction_factor: float,
+                          wake_reduction_pct: float, pedestrian_height: float,
+                          reference_height: float, surface_roughness: float) -> Tuple[float, ...]:
+    """
+    Efekty miejskie dla danego wiatru i parametrów zabudowy (wyniki zapamiętywane między wywołaniami).
+    
+    Współczynniki zabudowy przekazywane są już policzone (stałe instancji WindSimulator).
+    Zwraca krotkę w kolejności _URBAN_EFFECT_KEYS - słownik buduje wywołujący,
+    więc wyniki z cache nie są współdzielone jako obiekty modyfikowalne.
+    """
+    # 1. Efekt tunelu wiatrowego między budynkami
+    # Przyspieszenie wynikające z przewężenia przekroju
+    max_tunnel_speed = wind_speed_ref * tunnel_factor
+    
+    # 2. Strefy cienia aerodynamicznego za budynkami
+    # Redukcja prędkości w obszarach nawietrznych
+    min_wake_speed = wind_speed_ref * wake_speed_ratio
+    
+    # 3. Efekt szorstkości miejskiej - redukcja średniej prędkości
+    avg_urban_speed = wind_speed_ref * urban_reduction_factor
+    
+    # 4. Prędkość na poziomie pieszego (1.5m)
+    pedestrian_speed = _wind_profile(float(pedestrian_height), float(wind_speed_ref),
+                                     float(reference_height), float(surface_roughness))
+    
+    # 5. Efekty kierunkowe (anizotropia ze względu na układ ulic)
+    directional_factor = _directional_factor(direction)
+    
+    return (
+        max_tunnel_speed * directional_factor,
+        min_wake_speed * directional_factor,
+        avg_urban_speed * directional_factor,
+        pedestrian_speed * directional_factor,
+        directional_factor,
+        tunnel_factor,
+        wake_reduction_pct
+    )
+
+
+@functools.lru_cache(maxsize=1024)
+def _wind_pressure_cached(wind_speed: float, air_density: float) -> Tuple[float, ...]:
+    """Ciśnienia wiatru [Pa] w kolejności _WIND_PRESSURE_KEYS (wyniki zapamiętywane między wywołaniami)."""
+    # Ciśnienie dynamiczne wiatru (q = 0.5 * ρ * v²)
+    dynamic_pressure = 0.5 * air_density * wind_speed**2
+    return (dynamic_pressure, *(dynamic_pressure * _CP_VEC).tolist())
+
+
+@functools.lru_cache(maxsize=256)
+def _generate_wind_field_cached(seed_value: int, num_points: int, center_lat: float,
+                                center_lng: float, base_speed: Tuple[float, ...],
+                                direction: float) -> WindField:
+    """
+    Losuje pole wiatru dla danego ziarna i prędkości bazowych (wyniki zapamiętywane między wywołaniami).
+    
+    Tablice wyniku są tylko do odczytu, bo współdzieli je każde trafienie w cache.
+    """
+    rng = np.random.default_rng(seed_value)
+    
+    # Lokalizacje punktów (rozkład normalny wokół centrum) - wszystkie naraz
+    lat = center_lat + rng.normal(0, 0.008, num_points)   # ~±900m
+    lng = center_lng + rng.normal(0, 0.012, num_points)   # ~±1200m
+    
+    # Lokalna prędkość z wariancją przestrzenną
+    spatial_variation = rng.uniform(0.6, 1.4, num_points)
+    
+    # Wybór typu mikrośrodowiska (kody indeksujące _ENVIRONMENT_TYPES)
+    env_code = rng.choice(len(_ENVIRONMENT_TYPES), size=num_points, p=_ENVIRONMENT_PROBABILITIES)
+    
+    # Odchylenia kierunku od głównego (±25° przed skalowaniem wg mikrośrodowiska)
+    direction_deviation = rng.normal(0, 25, num_points)
+    
+    # Wysokość nad gruntem dla punktów
+    height_agl = rng.uniform(1.0, 20.0, num_points)  # 1-20m nad gruntem
+    
+    # Prędkości, kierunki i wektory liczone kernelem do ciągłych kolumn
+    field = WindField(
+        lat=lat, lng=lng,
+        speed=np.empty(num_points), direction=np.empty(num_points),
+        vx=np.empty(num_points), vy=np.empty(num_points),
+        height_agl=height_agl, turbulence_intensity=np.empty(num_points),
+        env_code=env_code.astype(np.int8), gust_factor=np.empty(num_points)
+    )
+    _fill_wind_field(env_code, spatial_variation, direction_deviation, np.array(base_speed), direction,
+                     field.speed, field.direction, field.vx, field.vy,
+                     field.turbulence_intensity, field.gust_factor)
+    
+    for name, decimals in _WIND_FIELD_DECIMALS.items():
+        column = getattr(field, name)
+        np.round(column, decimals, out=column)
+    for name in WindField.__dataclass_fields__:
+        getattr(field, name).flags.writeable = False
+    return field
+
 
 class WindSimulator:
     """
@@ -64,10 +493,19 @@ class WindSimulator:
         self.wake_reduction = 0.3           # redukcja w strefach cienia
         self.green_area_reduction = 0.4     # redukcja przez zieleń
         
-        print(f"💨 WindSim v1.9 initialized for {self.area_km2} km²")
-        print(f"   🏗️ Zabudowa: {self.building_density*100:.0f}%, h_avg={self.average_building_height}m")
-        print(f"   🌪️ Szorstkość: {self.surface_roughness}m (teren miejski)")
-        print(f"   📐 Wysokość ref: {self.reference_height}m")
+        # Stałe pochodne (niezmienne dla instancji)
+        self._tunnel_factor = 1.0 + (self.building_density * self.tunnel_amplification)
+        self._wake_speed_ratio = 1 - self.wake_reduction
+        self._urban_reduction_factor = 1 - (self.building_density * 0.4)
+        self._green_speed_ratio = 1 - self.green_area_reduction
+        self._wake_reduction_pct = self.wake_reduction * 100
+        
+        logger.info("💨 WindSim v1.9 initialized for %s km²\n"
+                    "   🏗️ Zabudowa: %.0f%%, h_avg=%sm\n"
+                    "   🌪️ Szorstkość: %sm (teren miejski)\n"
+                    "   📐 Wysokość ref: %sm",
+                    self.area_km2, self.building_density * 100, self.average_building_height,
+                    self.surface_roughness, self.reference_height)
     
     def calculate_wind_profile(self, height: float, u_ref: float, 
                               z_ref: float = None, z0: float = None) -> float:
@@ -78,27 +516,25 @@ class WindSimulator:
         z uwzględnieniem szorstkości powierzchni miejskiej.
         
         Args:
-            height (float): Wysokość nad gruntem [m]
+            height (float | np.ndarray): Wysokość nad gruntem [m] (skalar lub tablica)
             u_ref (float): Prędkość referencyjna [m/s]
             z_ref (float): Wysokość referencyjna [m] (domyślnie 10m)
             z0 (float): Parametr szorstkości [m] (domyślnie z konfiguracji)
             
         Returns:
-            float: Prędkość wiatru na wysokości 'height' [m/s]
+            float | np.ndarray: Prędkość wiatru na wysokości 'height' [m/s]
         """
         if z_ref is None:
             z_ref = self.reference_height
         if z0 is None:
             z0 = self.surface_roughness
-            
-        # Zabezpieczenie przed logarytmem z argumentu ≤ 0
-        if height <= z0:
-            height = z0 + 0.1
-            
-        # Profil logarytmiczny wiatru (ABL theory)
-        wind_speed = u_ref * np.log((height + z0) / z0) / np.log((z_ref + z0) / z0)
         
-        return max(0, wind_speed)
+        # Profil logarytmiczny wiatru (ABL theory) - tablice liczone równolegle
+        if not isinstance(height, (int, float)) and np.ndim(height) > 0:
+            heights = np.asarray(height, dtype=np.float64).ravel()
+            return _wind_profile_vec(heights, float(u_ref), float(z_ref), float(z0),
+                                     np.empty_like(heights)).reshape(np.shape(height))
+        return _wind_profile(float(height), float(u_ref), float(z_ref), float(z0))
     
     def calculate_urban_effects(self, wind_speed_ref: float, direction: float) -> Dict[str, float]:
         """
@@ -111,36 +547,12 @@ class WindSimulator:
         Returns:
             Dict[str, float]: Słownik z efektami miejskimi
         """
-        # 1. Efekt tunelu wiatrowego między budynkami
-        # Przyspieszenie wynikające z przewężenia przekroju
-        tunnel_factor = 1.0 + (self.building_density * self.tunnel_amplification)
-        max_tunnel_speed = wind_speed_ref * tunnel_factor
-        
-        # 2. Strefy cienia aerodynamicznego za budynkami
-        # Redukcja prędkości w obszarach nawietrznych
-        min_wake_speed = wind_speed_ref * (1 - self.wake_reduction)
-        
-        # 3. Efekt szorstkości miejskiej - redukcja średniej prędkości
-        urban_reduction_factor = 1 - (self.building_density * 0.4)
-        avg_urban_speed = wind_speed_ref * urban_reduction_factor
-        
-        # 4. Prędkość na poziomie pieszego (1.5m)
-        pedestrian_speed = self.calculate_wind_profile(
-            self.pedestrian_height, wind_speed_ref
+        values = _urban_effects_cached(
+            wind_speed_ref, direction, self._tunnel_factor, self._wake_speed_ratio,
+            self._urban_reduction_factor, self._wake_reduction_pct, self.pedestrian_height,
+            self.reference_height, self.surface_roughness
         )
-        
-        # 5. Efekty kierunkowe (anizotropia ze względu na układ ulic)
-        directional_factor = self._calculate_directional_factor(direction)
-        
-        return {
-            'max_tunnel_speed': max_tunnel_speed * directional_factor,
-            'min_wake_speed': min_wake_speed * directional_factor,
-            'avg_urban_speed': avg_urban_speed * directional_factor,
-            'pedestrian_speed': pedestrian_speed * directional_factor,
-            'directional_factor': directional_factor,
-            'tunnel_factor': tunnel_factor,
-            'wake_reduction_pct': self.wake_reduction * 100
-        }
+        return dict(zip(_URBAN_EFFECT_KEYS, values))
     
     def _calculate_directional_factor(self, direction: float) -> float:
         """
@@ -152,19 +564,7 @@ class WindSimulator:
         Returns:
             float: Współczynnik kierunkowy [0.8-1.2]
         """
-        # Główne kierunki ulic w Suwałkach (N-S, E-W orientation)
-        main_street_directions = [0, 90, 180, 270]  # N, E, S, W
-        
-        # Znajdź najbliższy główny kierunek
-        min_angle_diff = min(abs(direction - street_dir) for street_dir in main_street_directions)
-        
-        # Im bliżej głównego kierunku, tym większe wzmocnienie (tunele wiatrowe)
-        if min_angle_diff <= 15:      # ±15° od głównego kierunku
-            return 1.15               # +15% wzmocnienie
-        elif min_angle_diff <= 30:    # ±30° 
-            return 1.05               # +5% wzmocnienie
-        else:                         # Kierunki poprzeczne
-            return 0.9                # -10% redukcja
+        return _directional_factor(direction)
     
     def assess_pedestrian_comfort(self, wind_speed: float) -> Tuple[str, int, str]:
         """
@@ -177,56 +577,39 @@ class WindSimulator:
         - > 8 m/s: Niebezpieczne (utrudnione chodzenie)
         
         Args:
-            wind_speed (float): Prędkość wiatru [m/s]
+            wind_speed (float | np.ndarray): Prędkość wiatru [m/s] (skalar lub tablica)
             
         Returns:
-            Tuple[str, int, str]: (poziom_komfortu, score, opis)
-        """
-        if wind_speed < 4:
-            return "KOMFORTOWO", 1, "Warunki idealne do przebywania na zewnątrz"
-        elif wind_speed < 6:
-            return "AKCEPTOWALNE", 2, "Odpowiednie do spacerów i krótkiego przebywania"
-        elif wind_speed < 8:
-            return "NIEWŁAŚCIWE", 3, "Tylko do szybkiego przejścia, dyskomfort"
-        elif wind_speed < 12:
-            return "NIEBEZPIECZNE", 4, "Trudności w chodzeniu, ryzyko upadku"
-        else:
-            return "EKSTREMALNIE NIEBEZPIECZNE", 5, "Niemożliwe przebywanie na zewnątrz"
+            Tuple[str, int, str]: (poziom_komfortu, score, opis) - dla tablicy
+            krotka tablic o kształcie wejścia
+        """
+        if isinstance(wind_speed, (int, float)) or np.ndim(wind_speed) == 0:
+            return _LAWSON_ROWS[bisect.bisect_right(_LAWSON_BOUNDS, wind_speed)]
+        idx = np.searchsorted(_LAWSON_THRESH, wind_speed, side='right')
+        return _LAWSON_LEVELS[idx], _LAWSON_SCORE[idx], _LAWSON_DESC[idx]
     
     def calculate_wind_pressure(self, wind_speed: float) -> Dict[str, float]:
         """
         Oblicza ciśnienia wiatru na konstrukcje budowlane.
         
         Args:
-            wind_speed (float): Prędkość wiatru [m/s]
+            wind_speed (float | np.ndarray): Prędkość wiatru [m/s] (skalar lub tablica)
             
         Returns:
-            Dict[str, float]: Ciśnienia w różnych strefach [Pa]
+            Dict[str, float]: Ciśnienia w różnych strefach [Pa] - dla tablicy
+            prędkości wartości są tablicami o kształcie wejścia
         """
-        # Ciśnienie dynamiczne wiatru (q = 0.5 * ρ * v²)
-        dynamic_pressure = 0.5 * self.air_density * wind_speed**2
-        
-        # Współczynniki ciśnienia dla typowej geometrii miejskiej
-        cp_windward = 0.8      # strona nawietrzna (+)
-        cp_leeward = -0.5      # strona zawietrzna (-)
-        cp_side = -0.7         # ściany boczne (-)
-        cp_roof_windward = -0.3 # dach nawietrzny (-)
-        cp_roof_leeward = -0.6  # dach zawietrzny (-)
-        
-        return {
-            'dynamic_pressure_pa': dynamic_pressure,
-            'windward_pressure_pa': dynamic_pressure * cp_windward,
-            'leeward_pressure_pa': dynamic_pressure * cp_leeward,
-            'side_pressure_pa': dynamic_pressure * cp_side,
-            'roof_windward_pa': dynamic_pressure * cp_roof_windward,
-            'roof_leeward_pa': dynamic_pressure * cp_roof_leeward,
-            'pressure_difference_pa': dynamic_pressure * (cp_windward - cp_leeward)
-        }
+        if not isinstance(wind_speed, (int, float)) and np.ndim(wind_speed) > 0:
+            dynamic_pressure = 0.5 * self.air_density * np.asarray(wind_speed, dtype=np.float64)**2
+            pressures = dynamic_pressure[..., None] * _CP_VEC
+            return {'dynamic_pressure_pa': dynamic_pressure,
+                    **{key: pressures[..., i] for i, key in enumerate(_CP_KEYS)}}
+        return dict(zip(_WIND_PRESSURE_KEYS, _wind_pressure_cached(wind_speed, self.air_density)))
     
-    def generate_wind_field(self, scenario_name: str, wind_speed_ref: float, 
-                           direction: float, urban_effects: Dict) -> List[Dict]:
+    def generate_wind_field_soa(self, scenario_name: str, wind_speed_ref: float, 
+                                direction: float, urban_effects: Dict) -> WindField:
         """
-        Generuje pole wiatru do wizualizacji na mapie.
+        Generuje pole wiatru w układzie kolumnowym (tablica NumPy na atrybut).
         
         Args:
             scenario_name (str): Nazwa scenariusza
@@ -235,77 +618,43 @@ class WindSimulator:
             urban_effects (Dict): Efekty miejskie
             
         Returns:
-            List[Dict]: Lista punktów pola wiatru z wektorami prędkości
+            WindField: Kolumny punktów pola wiatru, zaokrąglone do precyzji eksportu
+            (tablice tylko do odczytu - współdzielone między wywołaniami)
         """
         # Deterministyczne generowanie punktów (powtarzalne wyniki)
         seed_value = abs(int(direction) + int(wind_speed_ref * 10)) % (2**31)
-        np.random.seed(seed_value)
         
         # Liczba punktów proporcjonalna do prędkości wiatru
         num_points = min(100, max(20, int(wind_speed_ref * 5)))
         
-        wind_field_points = []
+        # Prędkość bazowa według mikrośrodowiska (kolejność jak _ENVIRONMENT_TYPES)
+        avg_speed = urban_effects['avg_urban_speed']
+        base_speed = (
+            avg_speed,                                      # open
+            urban_effects['max_tunnel_speed'],              # tunnel
+            urban_effects['min_wake_speed'],                # wake
+            avg_speed * self._green_speed_ratio,            # green
+            avg_speed * 1.1                                 # intersection - lekkie wzmocnienie
+        )
         
-        for i in range(num_points):
-            # Lokalizacja punktu (rozkład normalny wokół centrum)
-            lat = self.center_lat + np.random.normal(0, 0.008)   # ~±900m
-            lng = self.center_lng + np.random.normal(0, 0.012)   # ~±1200m
-            
-            # Lokalna prędkość z wariancją przestrzenną  
-            spatial_variation = np.random.uniform(0.6, 1.4)
-            
-            # Wybór typu mikrośrodowiska
-            environment_type = np.random.choice(
-                ['open', 'tunnel', 'wake', 'green', 'intersection'],
-                p=[0.3, 0.2, 0.2, 0.15, 0.15]
-            )
-            
-            # Modyfikacja prędkości według mikrośrodowiska
-            if environment_type == 'tunnel':
-                local_speed = urban_effects['max_tunnel_speed'] * spatial_variation
-                turbulence = 0.25  # Wysoka turbulencja w tunelach
-            elif environment_type == 'wake':
-                local_speed = urban_effects['min_wake_speed'] * spatial_variation  
-                turbulence = 0.15  # Średnia turbulencja w strefach cienia
-            elif environment_type == 'green':
-                local_speed = urban_effects['avg_urban_speed'] * (1 - self.green_area_reduction) * spatial_variation
-                turbulence = 0.1   # Niska turbulencja w parkach
-            elif environment_type == 'intersection':
-                local_speed = urban_effects['avg_urban_speed'] * 1.1 * spatial_variation  # Lekkie wzmocnienie
-                turbulence = 0.2   # Podwyższona turbulencja na skrzyżowaniach
-            else:  # 'open'
-                local_speed = urban_effects['avg_urban_speed'] * spatial_variation
-                turbulence = 0.12  # Średnia turbulencja terenu otwartego
-            
-            # Lokalny kierunek wiatru z odchyleniami od głównego
-            direction_deviation = np.random.normal(0, 25)  # ±25° standardowo
-            if environment_type in ['tunnel', 'intersection']:
-                direction_deviation *= 1.5  # Większe odchylenia w złożonych strukturach
-            
-            local_direction = (direction + direction_deviation) % 360
-            
-            # Składowe wektora wiatru (konwencja meteorologiczna -> matematyczna)
-            wind_angle_rad = np.radians(270 - local_direction)  # Konwersja: N=90°→0°, E=0°→270°
-            vx = local_speed * np.cos(wind_angle_rad)           # Składowa E-W
-            vy = local_speed * np.sin(wind_angle_rad)           # Składowa N-S
-            
-            # Wysokość nad gruntem dla tego punktu
-            height_agl = np.random.uniform(1.0, 20.0)  # 1-20m nad gruntem
+        return _generate_wind_field_cached(seed_value, num_points, self.center_lat, self.center_lng,
+                                           base_speed, float(direction))
+    
+    def generate_wind_field(self, scenario_name: str, wind_speed_ref: float, 
+                           direction: float, urban_effects: Dict) -> List[Dict]:
+        """
+        Generuje pole wiatru do wizualizacji na mapie.
+        
+        Args:
+            scenario_name (str): Nazwa scenariusza
+            wind_speed_ref (float): Referencyjna prędkość wiatru [m/s]
+            direction (float): Kierunek wiatru [°]
+            urban_effects (Dict): Efekty miejskie
             
-            wind_field_points.append({
-                "lat": round(lat, 6),
-                "lng": round(lng, 6),
-                "speed": round(local_speed, 2),
-                "direction": round(local_direction, 1),
-                "vx": round(vx, 2),
-                "vy": round(vy, 2),
-                "height_agl": round(height_agl, 1),
-                "turbulence_intensity": round(turbulence, 3),
-                "environment_type": environment_type,
-                "gust_factor": round(1 + turbulence * 0.5, 2)  # Współczynnik porywów
-            })
-        
-        return wind_field_points
+        Returns:
+            List[Dict]: Lista punktów pola wiatru z wektorami prędkości
+        """
+        return self.generate_wind_field_soa(scenario_name, wind_speed_ref, direction, urban_effects).to_records()
     
     def calculate_comfort_zones_distribution(self, urban_effects: Dict) -> Dict[str, float]:
         """
@@ -320,21 +669,12 @@ class WindSimulator:
         avg_speed = urban_effects['avg_urban_speed']
         
         # Model empiryczny rozkładu komfortu w zależności od średniej prędkości
-        if avg_speed < 3:
-            comfort_zones = {"komfortowo": 90, "akceptowalne": 8, "niewłaściwe": 2, "niebezpieczne": 0}
-        elif avg_speed < 5:
-            comfort_zones = {"komfortowo": 70, "akceptowalne": 20, "niewłaściwe": 8, "niebezpieczne": 2}
-        elif avg_speed < 8:
-            comfort_zones = {"komfortowo": 40, "akceptowalne": 35, "niewłaściwe": 20, "niebezpieczne": 5}
-        elif avg_speed < 12:
-            comfort_zones = {"komfortowo": 15, "akceptowalne": 25, "niewłaściwe": 40, "niebezpieczne": 20}
-        else:
-            comfort_zones = {"komfortowo": 5, "akceptowalne": 10, "niewłaściwe": 30, "niebezpieczne": 55}
-        
-        return comfort_zones
+        row = _COMFORT_ZONE_ROWS[bisect.bisect_right(_COMFORT_ZONE_BOUNDS, avg_speed)]
+        return dict(zip(_COMFORT_ZONE_KEYS, row))
     
     def simulate_scenario(self, wind_speed_ref: float, direction: float, 
-                         scenario_name: str, detailed_output: bool = True) -> Dict:
+                         scenario_name: str, detailed_output: bool = True,
+                         verbose: bool = True) -> Dict:
         """
         Główna funkcja symulująca scenariusz wiatru.
         
@@ -343,38 +683,98 @@ class WindSimulator:
             direction (float): Kierunek wiatru [° from North]
             scenario_name (str): Nazwa scenariusza
             detailed_output (bool): Czy generować szczegółowe dane wyjściowe
+            verbose (bool): Czy wypisywać logi scenariusza
             
         Returns:
             Dict: Kompletne wyniki symulacji CFD
         """
-        print(f"\n💨 WindSim: {scenario_name}")
-        print(f"   🧭 Wiatr: {wind_speed_ref} m/s z kierunku {direction}°")
-        
         # Oblicz efekty miejskie
         urban_effects = self.calculate_urban_effects(wind_speed_ref, direction)
         
         # Oceń komfort pieszych
-        pedestrian_comfort, comfort_score, comfort_description = \
-            self.assess_pedestrian_comfort(urban_effects['pedestrian_speed'])
+        pedestrian = self.assess_pedestrian_comfort(urban_effects['pedestrian_speed'])
         
         # Oblicz ciśnienia wiatru
         wind_pressures = self.calculate_wind_pressure(wind_speed_ref)
         
         # Rozkład stref komfortu
         comfort_zones = self.calculate_comfort_zones_distribution(urban_effects)
+        
+        result = self._build_result(
+            scenario_name, wind_speed_ref, direction, urban_effects, pedestrian,
+            wind_pressures, comfort_zones, detailed_output, datetime.now().isoformat()
+        )
+        
+        # Logi wynikowe
+        if verbose and logger.isEnabledFor(logging.INFO):
+            comfort_zones_percent = comfort_zones['komfortowo'] + comfort_zones['akceptowalne']
+            logger.info(
+                f"💨 WindSim: {scenario_name}\n"
+                f"   🧭 Wiatr: {wind_speed_ref} m/s z kierunku {direction}°\n"
+                f"   📊 Prędkość: {urban_effects['min_wake_speed']:.1f}-{urban_effects['max_tunnel_speed']:.1f} m/s\n"
+                f"   👥 Komfort pieszych: {comfort_zones_percent:.0f}% obszaru ({pedestrian[0]})\n"
+                f"   🏗️ Ciśnienie na budynki: {wind_pressures['dynamic_pressure_pa']:.0f} Pa\n"
+                f"   🌪️ Intensywność turbulencji: {pedestrian[1]}/5"
+            )
+        
+        return result
+    
+    def simulate_scenario_summary(self, wind_speed_ref: float, direction: float) -> WindSummary:
+        """
+        Szybka ścieżka scenariusza - tylko wielkości liczbowe, bez słownika wyniku.
+        
+        Pomija pole wiatru, znacznik czasu i logi; wartości jak w simulate_scenario
+        przed zaokrągleniem.
+        
+        Args:
+            wind_speed_ref (float): Referencyjna prędkość wiatru [m/s]
+            direction (float): Kierunek wiatru [° from North]
+            
+        Returns:
+            WindSummary: Podsumowanie scenariusza
+        """
+        (max_tunnel, min_wake, avg_urban, pedestrian,
+         directional_factor, _, _) = _urban_effects_cached(
+            wind_speed_ref, direction, self._tunnel_factor, self._wake_speed_ratio,
+            self._urban_reduction_factor, self._wake_reduction_pct, self.pedestrian_height,
+            self.reference_height, self.surface_roughness
+        )
+        pressures = _wind_pressure_cached(wind_speed_ref, self.air_density)
+        comfort_score = _LAWSON_ROWS[bisect.bisect_right(_LAWSON_BOUNDS, pedestrian)][1]
+        zones = _COMFORT_ZONE_ROWS[bisect.bisect_right(_COMFORT_ZONE_BOUNDS, avg_urban)]
+        return WindSummary(
+            wind_speed_ref, direction, max_tunnel, min_wake, avg_urban, pedestrian,
+            directional_factor, comfort_score, zones[0] + zones[1],
+            pressures[0], pressures[-1]
+        )
+    
+    def _build_result(self, scenario_name: str, wind_speed_ref: float, direction: float,
+                      urban_effects: Dict[str, float], pedestrian: Tuple[str, int, str],
+                      wind_pressures: Dict[str, float], comfort_zones: Dict[str, float],
+                      detailed_output: bool, timestamp: str) -> Dict:
+        """
+        Składa słownik wyniku scenariusza z policzonych wielkości przepływu.
+        
+        Wspólne dla simulate_scenario i batch_simulate_vec; pole wiatru
+        generowane jest tu tylko dla detailed_output=True.
+        
+        Returns:
+            Dict: Kompletne wyniki symulacji CFD
+        """
+        pedestrian_comfort, comfort_score, comfort_description = pedestrian
         comfort_zones_percent = comfort_zones['komfortowo'] + comfort_zones['akceptowalne']
         
-        # Generuj pole wiatru do wizualizacji
+        # Generuj pole wiatru do wizualizacji (kolumny WindField - słowniki dopiero przy eksporcie)
         wind_field = []
         if detailed_output:
-            wind_field = self.generate_wind_field(scenario_name, wind_speed_ref, direction, urban_effects)
+            wind_field = self.generate_wind_field_soa(scenario_name, wind_speed_ref, direction, urban_effects)
         
         # Strukturyzacja wyników
         result = {
             'scenario_name': scenario_name,
             'module': 'WindSim',
             'model_version': 'WindSim_v1.9_CFD',
-            'computation_time': datetime.now().isoformat(),
+            'computation_time': timestamp,
             
             'parameters': {
                 'wind_speed_ref': wind_speed_ref,
@@ -429,35 +829,192 @@ class WindSimulator:
                 'particle_count': len(wind_field)
             }
         
-        # Logi wynikowe
-        print(f"   📊 Prędkość: {urban_effects['min_wake_speed']:.1f}-{urban_effects['max_tunnel_speed']:.1f} m/s")
-        print(f"   👥 Komfort pieszych: {comfort_zones_percent:.0f}% obszaru ({pedestrian_comfort})")
-        print(f"   🏗️ Ciśnienie na budynki: {wind_pressures['dynamic_pressure_pa']:.0f} Pa")
-        print(f"   🌪️ Intensywność turbulencji: {comfort_score}/5")
-        
         return result
     
-    def batch_simulate(self, scenarios: List[Tuple[float, float, str]]) -> Dict[str, Dict]:
+    def batch_simulate(self, scenarios: List[Tuple[float, float, str]],
+                       verbose: bool = False) -> Dict[str, Dict]:
         """
         Uruchamia batch symulacji CFD dla wielu scenariuszy.
         
         Args:
             scenarios (List[Tuple]): Lista (wind_speed, direction, name)
+            verbose (bool): Czy logować wyniki poszczególnych scenariuszy
             
         Returns:
             Dict[str, Dict]: Wyniki wszystkich scenariuszy  
         """
         results = {}
         
-        print(f"\n🔄 CFD Batch simulation: {len(scenarios)} scenarios")
+        logger.info("🔄 CFD Batch simulation: %d scenarios", len(scenarios))
         
         for i, (speed, direction, name) in enumerate(scenarios, 1):
-            print(f"\n[{i}/{len(scenarios)}]", end=" ")
-            result = self.simulate_scenario(speed, direction, name)
+            if verbose:
+                logger.info("[%d/%d]", i, len(scenarios))
+            result = self.simulate_scenario(speed, direction, name, verbose=verbose)
             key = name.lower().replace(" ", "_").replace("-", "")
             results[key] = result
         
-        print(f"\n✅ CFD Batch completed: {len(results)} scenarios")
+        logger.info("✅ CFD Batch completed: %d scenarios", len(results))
+        return results
+    
+    def batch_simulate_vec(self, speeds: np.ndarray, directions: np.ndarray,
+                           names: List[str], detailed_output: bool = True) -> Dict[str, Dict]:
+        """
+        Wektorowy wariant batch_simulate dla przeglądów parametrów (np. róża wiatrów).
+        
+        Efekty miejskie, komfort pieszych, rozkład stref i ciśnienia liczone są
+        jednym przebiegiem po tablicach NumPy; pętla po scenariuszach składa tylko
+        słowniki wyników (i ewentualnie pole wiatru).
+        
+        Args:
+            speeds (np.ndarray): Referencyjne prędkości wiatru [m/s]
+            directions (np.ndarray): Kierunki wiatru [°]
+            names (List[str]): Nazwy scenariuszy
+            detailed_output (bool): Czy generować pole wiatru
+            
+        Returns:
+            Dict[str, Dict]: Wyniki wszystkich scenariuszy (jak batch_simulate)
+            
+        Raises:
+            ValueError: Gdy tablice wejściowe i lista nazw mają różne długości
+        """
+        speeds = np.asarray(speeds)
+        directions = np.asarray(directions)
+        if not len(names) == speeds.size == directions.size:
+            raise ValueError(f"Niezgodne długości wejścia: {len(names)} nazw, {speeds.size} prędkości, "
+                             f"{directions.size} kierunków")
+        
+        logger.info("🔄 CFD Vectorized batch: %d scenarios", len(names))
+        
+        sweep = self._sweep_arrays(speeds, directions)
+        tunnel_factor = self._tunnel_factor
+        wake_reduction_pct = self._wake_reduction_pct
+        timestamp = datetime.now().isoformat()
+        results = {}
+        for row in zip(names, speeds.tolist(), directions.tolist(), sweep.max_tunnel.tolist(),
+                       sweep.min_wake.tolist(), sweep.avg_urban.tolist(), sweep.pedestrian.tolist(),
+                       sweep.directional_factor.tolist(), sweep.lawson_idx.tolist(),
+                       sweep.zone_rows.tolist(), sweep.dynamic_pressure.tolist(),
+                       sweep.pressures.tolist()):
+            (name, speed, direction, tunnel, wake, avg, ped, factor,
+             lawson, zones, q, cp_pressures) = row
+            urban_effects = dict(zip(_URBAN_EFFECT_KEYS, (tunnel, wake, avg, ped, factor,
+                                                          tunnel_factor, wake_reduction_pct)))
+            pedestrian_comfort = (str(_LAWSON_LEVELS[lawson]), int(_LAWSON_SCORE[lawson]),
+                                  str(_LAWSON_DESC[lawson]))
+            wind_pressures = dict(zip(_WIND_PRESSURE_KEYS, (q, *cp_pressures)))
+            comfort_zones = dict(zip(_COMFORT_ZONE_KEYS, zones))
+            key = name.lower().replace(" ", "_").replace("-", "")
+            results[key] = self._build_result(
+                name, speed, direction, urban_effects, pedestrian_comfort, wind_pressures,
+                comfort_zones, detailed_output, timestamp
+            )
+        
+        logger.info("✅ CFD Vectorized batch completed: %d scenarios", len(results))
+        return results
+    
+    def batch_simulate_summary(self, speeds: np.ndarray, directions: np.ndarray) -> WindSweep:
+        """
+        Wektorowy przegląd parametrów zwracający tylko podsumowania liczbowe.
+        
+        Bez słowników wyniku, pola wiatru, znaczników czasu i logów per scenariusz;
+        wyniki trzymane są kolumnowo (jedna tablica na wielkość dla całego przeglądu).
+        Pełny wynik dla wybranego scenariusza daje simulate_scenario.
+        
+        Args:
+            speeds (np.ndarray): Referencyjne prędkości wiatru [m/s]
+            directions (np.ndarray): Kierunki wiatru [°]
+            
+        Returns:
+            WindSweep: Kolumny podsumowań w kolejności wejścia (sweep[i] -> WindSummary)
+        """
+        speeds = np.asarray(speeds, dtype=np.float64)
+        directions = np.asarray(directions, dtype=np.float64)
+        sweep = self._sweep_arrays(speeds, directions)
+        return WindSweep(
+            wind_speed_ref=speeds,
+            direction=directions,
+            max_speed=sweep.max_tunnel,
+            min_speed=sweep.min_wake,
+            avg_urban_speed=sweep.avg_urban,
+            pedestrian_speed=sweep.pedestrian,
+            directional_factor=sweep.directional_factor,
+            comfort_score=_LAWSON_SCORE[sweep.lawson_idx].astype(np.int8),
+            comfort_zones_percent=(sweep.zone_rows[:, 0] + sweep.zone_rows[:, 1]).astype(np.int16),
+            dynamic_pressure_pa=sweep.dynamic_pressure,
+            pressure_difference_pa=sweep.pressures[:, -1]
+        )
+    
+    def _sweep_arrays(self, speeds: np.ndarray, directions: np.ndarray) -> SimpleNamespace:
+        """
+        Wielkości przepływu dla tablic prędkości i kierunków (jeden przebieg NumPy).
+        
+        Returns:
+            SimpleNamespace: Tablice max_tunnel, min_wake, avg_urban, pedestrian,
+            directional_factor, lawson_idx, zone_rows, dynamic_pressure, pressures
+        """
+        # Efekty miejskie (calculate_urban_effects)
+        directional_factor = _directional_factor_np(directions)
+        avg_urban = speeds * self._urban_reduction_factor * directional_factor
+        
+        # Prędkość na poziomie pieszego - ten sam kernel _wind_profile co ścieżka skalarna,
+        # żeby progi Lawsona klasyfikowały identyczne wartości
+        u_refs = speeds.astype(np.float64)
+        pedestrian = _wind_profile_speeds(float(self.pedestrian_height), u_refs,
+                                          float(self.reference_height), float(self.surface_roughness),
+                                          np.empty_like(u_refs)) * directional_factor
+        
+        # Ciśnienia wiatru (calculate_wind_pressure) - iloczyn zewnętrzny z wektorem Cp
+        dynamic_pressure = 0.5 * self.air_density * speeds**2
+        
+        return SimpleNamespace(
+            max_tunnel=speeds * self._tunnel_factor * directional_factor,
+            min_wake=speeds * self._wake_speed_ratio * directional_factor,
+            avg_urban=avg_urban,
+            pedestrian=pedestrian,
+            directional_factor=directional_factor,
+            # Komfort pieszych (kryteria Lawsona) i rozkład stref komfortu
+            lawson_idx=np.searchsorted(_LAWSON_THRESH, pedestrian, side='right'),
+            zone_rows=_COMFORT_ZONE_TABLE[np.searchsorted(_COMFORT_ZONE_THRESH, avg_urban, side='right')],
+            dynamic_pressure=dynamic_pressure,
+            pressures=dynamic_pressure[:, None] * _CP_VEC
+        )
+    
+    def batch_simulate_parallel(self, scenarios: List[Tuple[float, float, str]],
+                                workers: Optional[int] = None,
+                                detailed_output: bool = True) -> Dict[str, Dict]:
+        """
+        Uruchamia batch symulacji CFD równolegle w puli procesów.
+        
+        Scenariusze są niezależne (lokalny generator losowy w każdym),
+        logi per scenariusz są wyłączone - postęp loguje proces główny.
+        
+        Args:
+            scenarios (List[Tuple]): Lista (wind_speed, direction, name)
+            workers (Optional[int]): Liczba procesów (domyślnie os.cpu_count())
+            detailed_output (bool): Czy generować pole wiatru
+            
+        Returns:
+            Dict[str, Dict]: Wyniki wszystkich scenariuszy (jak batch_simulate)
+        """
+        results = {}
+        
+        logger.info("🔄 CFD Parallel Batch: %d scenarios", len(scenarios))
+        
+        workers = workers or os.cpu_count()
+        # Scenariusz liczy się w ułamku milisekundy - paczki po kilka scenariuszy na zadanie,
+        # żeby narzut IPC nie przeważał nad obliczeniami
+        chunksize = max(1, len(scenarios) // (workers * 4))
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            run = functools.partial(_run_scenario, self, detailed_output=detailed_output)
+            outputs = executor.map(run, scenarios, chunksize=chunksize)
+            for i, (scenario, result) in enumerate(zip(scenarios, outputs), 1):
+                name = scenario[2]
+                logger.info("   [%d/%d] %s", i, len(scenarios), name)
+                key = name.lower().replace(" ", "_").replace("-", "")
+                results[key] = result
+        
+        logger.info("✅ CFD Parallel Batch completed: %d scenarios", len(results))
         return results
     
     def export_results(self, results: Dict, output_file: str = "wind_results.json"):
@@ -487,13 +1044,30 @@ class WindSimulator:
             "results": results
         }
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(export_data, f, indent=2, ensure_ascii=False, default=str)
+        if orjson is not None:
+            # WindField (dataclass) przekazywany do default - eksport jako lista słowników
+            with open(output_file, 'wb') as f:
+                f.write(orjson.dumps(
+                    export_data, default=_export_default,
+                    option=(orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS |
+                            orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_PASSTHROUGH_DATACLASS)
+                ))
+        else:
+            with open(output_file, 'w', encoding='utf-8') as f:
+                json.dump(export_data, f, indent=2, ensure_ascii=False, default=_export_default)
         
-        print(f"💾 CFD results exported to: {output_file}")
+        logger.info("💾 CFD results exported to: %s", output_file)
+
+def _run_scenario(simulator: "WindSimulator", scenario: Tuple[float, float, str],
+                  detailed_output: bool = True) -> Dict:
+    """Uruchamia pojedynczy scenariusz bez logów (funkcja modułowa - picklowalna dla puli procesów)."""
+    speed, direction, name = scenario
+    return simulator.simulate_scenario(speed, direction, name, detailed_output, verbose=False)
 
 # Przykłady użycia
 if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(message)s")
+    
     # Przykładowa konfiguracja dla testów
     test_config = {
         'location': {
@@ -518,5 +1092,5 @@ if __name__ == "__main__":
         (25, 270, "Wiatr burzowy - zachód")
     ]
     
-    batch_results = wind_sim.batch_simulate(scenarios)
+    batch_results = wind_sim.batch_simulate(scenarios, verbose=True)
     wind_sim.export_results(batch_results, "wind_batch_results.json")
\ No newline at end of file